@@ -9,21 +9,35 @@ This CLI requires sudo for full functionality (network setup, DNS config, etc.)
 """
 
 import atexit
-import getpass
+import bisect
 import json
 import os
+import platform
+import re
 import readline
 import shlex
-import shutil
 import signal
 import subprocess
 import sys
 import time
-import urllib.error
-import urllib.request
-import yaml
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+
+# orjson parses the (sometimes large) sidecar JSON payloads several times
+# faster than the stdlib. It is optional - fall back to json when absent.
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2)
 from pathlib import Path
 
 
@@ -42,6 +56,8 @@ def check_root():
 
 CONFIG_FILE = Path.home() / ".voipbin-cli.conf"
 HISTORY_FILE = Path.home() / ".voipbin-cli-history"
+TOKEN_FILE = Path.home() / ".voipbin" / "token"
+TOKEN_TTL = 3600  # seconds - matches the API's JWT lifetime
 
 DEFAULT_CONFIG = {
     "api_host": "localhost",
@@ -105,33 +121,213 @@ class Colors:
     def disable(cls):
         cls.GREEN = cls.RED = cls.YELLOW = cls.BLUE = ""
         cls.GRAY = cls.WHITE = cls.BOLD = cls.DIM = cls.RESET = ""
+        # Drop any strings memoized while colors were still enabled
+        for helper in (green, red, yellow, blue, gray, white, bold, dim,
+                       _dns_list_body):
+            helper.cache_clear()
+        _refresh_status_glyphs()
 
 
+# The helpers are memoized so hot paths (verbose log tags, table rows,
+# status icons) don't rebuild the same wrapped literal thousands of times.
+# Colors.disable() clears the caches, so the colors=false config still works.
+
+@lru_cache(maxsize=256)
 def green(text):
     return f"{Colors.GREEN}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def red(text):
     return f"{Colors.RED}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def yellow(text):
     return f"{Colors.YELLOW}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def blue(text):
     return f"{Colors.BLUE}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def gray(text):
     return f"{Colors.GRAY}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def white(text):
     return f"{Colors.WHITE}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def bold(text):
     return f"{Colors.BOLD}{text}{Colors.RESET}"
 
+@lru_cache(maxsize=256)
 def dim(text):
     return f"{Colors.DIM}{text}{Colors.RESET}"
 
 
+# Pre-rendered status glyphs for the hot print paths. These are plain module
+# globals (no call per use); Colors.disable() re-renders them so colors=false
+# output stays clean.
+def _refresh_status_glyphs():
+    global GREEN_CHECK, RED_CROSS, YELLOW_BANG
+    global GREEN_CIRCLE, RED_CIRCLE, GRAY_CIRCLE
+    GREEN_CHECK = green("✓")
+    RED_CROSS = red("✗")
+    YELLOW_BANG = yellow("!")
+    GREEN_CIRCLE = green("●")
+    RED_CIRCLE = red("○")
+    GRAY_CIRCLE = gray("○")
+
+
+_refresh_status_glyphs()
+
+
+# The dns list reference page is large but almost entirely static; memoize
+# the rendered text per IP triple so repeat invocations in an interactive
+# session skip the formatting work. Colors.disable() clears this cache too.
+@lru_cache(maxsize=4)
+def _dns_list_body(host_ip, kamailio_ip, rtpengine_ip):
+    return f"""
+{bold('VoIPBin DNS Domains')}
+{'=' * 70}
+
+{bold('IP Configuration')}
+  Host IP:      {host_ip} (web services)
+  Kamailio IP:  {kamailio_ip} (SIP signaling)
+  RTPEngine IP: {rtpengine_ip} (RTP media)
+
+{bold('Web Services')} (resolve to Host IP, Docker port mapping)
+{'-' * 70}
+  {'Domain':<35} {'Resolves To':<18} {'Port'}
+  {'api.voipbin.test':<35} {host_ip:<18} :8443
+  {'admin.voipbin.test':<35} {host_ip:<18} :3003
+  {'meet.voipbin.test':<35} {host_ip:<18} :3004
+  {'talk.voipbin.test':<35} {host_ip:<18} :3005
+
+{bold('SIP/VoIP Services')} (resolve to Kamailio IP: {kamailio_ip})
+{'-' * 70}
+  {'Domain':<35} {'Port':<8} {'Description'}
+  {'sip.voipbin.test':<35} {'5060':<8} SIP proxy (UDP/TCP)
+  {'sip-service.voipbin.test':<35} {'5060':<8} SIP proxy (alias)
+  {'pstn.voipbin.test':<35} {'5060':<8} PSTN gateway
+  {'trunk.voipbin.test':<35} {'5060':<8} SIP trunking
+  {'*.registrar.voipbin.test':<35} {'5060':<8} SIP registration
+                                             (e.g., {{customer_id}}.registrar.voipbin.test)
+
+{bold('Internal Services')} (Docker bridge network)
+{'-' * 70}
+  {'Service':<35} {'IP':<16} {'Description'}
+  {'api-manager':<35} {'172.28.0.100':<16} API Manager container
+  {'square-admin':<35} {'172.28.0.101':<16} Admin Console container
+  {'square-meet':<35} {'172.28.0.102':<16} Meet container
+  {'square-talk':<35} {'172.28.0.103':<16} Talk container
+
+{bold('Example SIP URIs')}
+{'-' * 70}
+  Extension registration:  sip:1000@{{customer_id}}.registrar.voipbin.test
+  Extension call:          sip:2000@{{customer_id}}.registrar.voipbin.test
+  PSTN call:               sip:+15551234567@pstn.voipbin.test
+
+{bold('DNS Commands')}
+{'-' * 70}
+  dns status    Check DNS configuration status
+  dns list      Show this domain reference
+  dns setup     Configure DNS forwarding to CoreDNS
+  dns test      Test domain resolution
+"""
+
+
+def classify_status(status):
+    """Map a docker status string to one of: up, restarting, stopped, unknown"""
+    status_lower = status.lower()
+    if "up" in status_lower:
+        return "up"
+    if "restarting" in status_lower:
+        return "restarting"
+    if status:
+        return "stopped"
+    return "unknown"
+
+
+# Icon per classification. Looked up lazily so Colors.disable() applies;
+# the color helpers memoize the rendered glyphs anyway.
+_STATUS_ICONS = {
+    "up": lambda: green("●"),
+    "restarting": lambda: yellow("◐"),
+    "stopped": lambda: red("○"),
+    "unknown": lambda: gray("○"),
+}
+
+
+# Endpoint tables for cmd_status. VoIP endpoints carry a {host} placeholder
+# filled with HOST_EXTERNAL_IP at render time.
+_ENDPOINT_SERVICES = {
+    "admin": ("Admin Console", "http://admin.voipbin.test:3003", None),
+    "api-mgr": ("API Manager", "https://api.voipbin.test:8443", None),
+    "mq": ("RabbitMQ", "http://localhost:15672", "guest / guest"),
+    "db": ("MySQL", "localhost:3306", "root / root_password"),
+}
+
+_VOIP_ENDPOINTS = {
+    "kamailio": [
+        ("SIP (UDP/TCP)", "{host}:5060"),
+        ("SIP (TLS)", "{host}:5061"),
+        ("SIP (WSS)", "wss://{host}:443"),
+    ],
+    "rtpengine": [("RTPEngine", "{host}:22222")],
+    "ast-registrar": [("Asterisk Registrar", "{host}:5082")],
+    "ast-call": [("Asterisk Call", "{host}:5080")],
+}
+
+# Services already covered by the endpoint sections above
+_SHOWN_SERVICES = frozenset(_ENDPOINT_SERVICES) | frozenset(_VOIP_ENDPOINTS)
+
+
+# (path -> (mtime_ns, is_dummy)) for GCP credential dummy detection, so
+# repeated status calls don't re-read the JSON file from disk
+_GCP_DUMMY_CACHE = {}
+
+
+def _is_dummy_gcp_credentials(path):
+    """True when the GCP credentials file is the generated placeholder"""
+    if "dummy" in path.lower():
+        return True
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return False
+    cached = _GCP_DUMMY_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    is_dummy = False
+    try:
+        with open(path) as f:
+            is_dummy = "dummy-project" in f.read()
+    except OSError:
+        pass
+    _GCP_DUMMY_CACHE[path] = (mtime, is_dummy)
+    return is_dummy
+
+
+# Provider configuration checks rendered by cmd_status:
+# (section header or None, label, required env vars, note when configured).
+# A provider counts as configured when every listed variable is set.
+_PROVIDER_CHECKS = [
+    ("Telephony", "Twilio", ("TWILIO_SID", "TWILIO_API_KEY"), None),
+    (None, "Telnyx", ("TELNYX_API_KEY",), None),
+    ("Email", "SendGrid", ("SENDGRID_API_KEY",), None),
+    (None, "Mailgun", ("MAILGUN_API_KEY",), None),
+    ("Cloud Services", "AWS", ("AWS_ACCESS_KEY", "AWS_SECRET_KEY"), "(transcription)"),
+]
+
+# Optional AI add-ons grouped into one summary line
+_AI_SERVICE_VARS = [
+    ("Deepgram", "DEEPGRAM_API_KEY"),
+    ("Cartesia", "CARTESIA_API_KEY"),
+    ("ElevenLabs", "ELEVENLABS_API_KEY"),
+]
+
+
 # =============================================================================
 # Welcome Dashboard
 # =============================================================================
@@ -603,6 +799,10 @@ SIDECAR_REQUIRED_ARGS = {
     ("hook", "hook", "send-message"): ["uri"],
 }
 
+# Frozen views derived once at import for O(1) missing-argument checks.
+# The lists above stay authoritative so prompting order is deterministic.
+_REQUIRED_ARG_SETS = {key: frozenset(value) for key, value in SIDECAR_REQUIRED_ARGS.items()}
+
 # Commands that require delete confirmation
 SIDECAR_DELETE_COMMANDS = [
     ("billing", "account", "delete"),
@@ -631,6 +831,18 @@ SIDECAR_DELETE_COMMANDS = [
     ("talk", "message", "delete"),
 ]
 
+# Frozen view of the list above for the per-invocation membership check.
+_SIDECAR_DELETE_SET = frozenset(SIDECAR_DELETE_COMMANDS)
+
+# (service, subcmd) -> valid action tuple, flattened once at import so the
+# runners skip the nested dict walk per invocation. Tuples keep the order
+# used in "Available:" error messages stable.
+_SIDECAR_VALID_ACTIONS = {
+    (service, subcmd): tuple(info.get("commands", []))
+    for service, cfg in SIDECAR_COMMANDS.items()
+    for subcmd, info in cfg.get("subcommands", {}).items()
+}
+
 # Table columns for list commands (command_key -> [(display_name, json_key, width)])
 SIDECAR_TABLE_COLUMNS = {
     ("billing", "account", "list"): [
@@ -1014,6 +1226,13 @@ SIDECAR_DETAIL_FIELDS = {
     ],
 }
 
+# Normalized once at import: each field gains an is-timestamp flag so
+# format_details doesn't substring-test every json key on every render.
+SIDECAR_DETAIL_FIELDS = {
+    key: [(display, json_key, "tm_" in json_key) for display, json_key in fields]
+    for key, fields in SIDECAR_DETAIL_FIELDS.items()
+}
+
 
 def get_logo():
     """Return the combined ASCII logo with colors"""
@@ -1039,8 +1258,7 @@ def detect_dashboard_state():
         return "not_initialized"
 
     # Check for running containers
-    output = run_cmd("docker compose ps --format '{{.Name}}' 2>/dev/null")
-    if output and output.strip():
+    if get_compose_ps():
         return "running"
 
     return "stopped"
@@ -1049,39 +1267,31 @@ def detect_dashboard_state():
 def get_quick_status():
     """Get quick status for running state dashboard"""
     # Get running containers
-    output = run_cmd("docker compose ps --format '{{.Name}}\t{{.Status}}' 2>/dev/null")
-
     running = []
     stopped = []
 
-    if output:
-        for line in output.strip().split('\n'):
-            if not line:
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                name = parts[0].replace("voipbin-", "")
-                status = parts[1]
-                if "up" in status.lower():
-                    running.append(name)
-                else:
-                    stopped.append(name)
+    for name, status in get_compose_ps():
+        name = name.replace("voipbin-", "")
+        if classify_status(status) == "up":
+            running.append(name)
+        else:
+            stopped.append(name)
 
     # Get total services
     total_output = run_cmd("docker compose config --services 2>/dev/null")
     total = len(total_output.strip().split('\n')) if total_output else 0
 
     # Check DNS status
-    coredns_running = "dns" in running or "voipbin-dns" in run_cmd("docker ps --format '{{.Names}}' 2>/dev/null")
+    coredns_running = "dns" in running or "voipbin-dns" in get_running_container_names()
     resolv_configured = "nameserver 127.0.0.1" in run_cmd("cat /etc/resolv.conf 2>/dev/null")
     dns_active = coredns_running and resolv_configured
 
     # Check network status
-    kamailio_int = run_cmd("ip addr show kamailio-int 2>/dev/null | grep -oP 'inet [\\d./]+' | head -1")
-    network_configured = bool(kamailio_int)
+    kamailio_int = run_argv(["ip", "addr", "show", "kamailio-int"], merge_stderr=False)
+    network_configured = bool(_INET_RE.search(kamailio_int))
 
     # Get host IP for endpoints
-    host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "localhost"
+    host_ip = _parse_env_file().get("HOST_EXTERNAL_IP") or "localhost"
 
     return {
         "running_count": len(running),
@@ -1139,10 +1349,10 @@ def show_welcome_dashboard():
         status = get_quick_status()
 
         # Status indicators
-        running_indicator = green("●") if status["running_count"] > 0 else gray("○")
-        dns_indicator = green("●") if status["dns_active"] else gray("○")
+        running_indicator = GREEN_CIRCLE if status["running_count"] > 0 else GRAY_CIRCLE
+        dns_indicator = GREEN_CIRCLE if status["dns_active"] else GRAY_CIRCLE
         dns_status = "active" if status["dns_active"] else "not configured"
-        network_indicator = green("●") if status["network_configured"] else gray("○")
+        network_indicator = GREEN_CIRCLE if status["network_configured"] else GRAY_CIRCLE
         network_status = "configured" if status["network_configured"] else "not configured"
 
         # Helper to pad string accounting for ANSI codes
@@ -1161,7 +1371,7 @@ def show_welcome_dashboard():
         if status["stopped_services"]:
             stopped_str = ', '.join(status['stopped_services'][:3])
             svc2_plain = f"* {stopped_str}"
-            svc2_color = f"{gray('○')} {gray(stopped_str)}"
+            svc2_color = f"{GRAY_CIRCLE} {gray(stopped_str)}"
 
         svc4_plain = f"DNS: * {dns_status}"
         svc4_color = f"DNS: {dns_indicator} {dns_status}"
@@ -1241,6 +1451,26 @@ class Config:
 # Command Execution Helpers
 # =============================================================================
 
+def _parse_env_file(path=".env"):
+    """Parse a dotenv-style file into a dict.
+
+    Replaces the grep|cut|head pipelines that used to fork three processes
+    per variable. First definition of a key wins, matching grep|head -1.
+    """
+    env = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                env.setdefault(key, value)
+    except OSError:
+        pass
+    return env
+
+
 def run_cmd(cmd, capture=True, check=False):
     """Run a shell command and return output"""
     try:
@@ -1256,24 +1486,50 @@ def run_cmd(cmd, capture=True, check=False):
         return e.stderr.strip() if e.stderr else str(e)
 
 
-def docker_exec(container, cmd, interactive=False):
-    """Execute command in a docker container"""
+def run_argv(argv, merge_stderr=True):
+    """Run a command without a shell and return its stripped output.
+
+    Argv-list flavor of run_cmd for the hot lifecycle paths - skips the
+    /bin/sh fork and shell parsing, and sidesteps quoting issues.
+    """
+    try:
+        result = subprocess.run(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if merge_stderr else subprocess.DEVNULL,
+            text=True,
+        )
+        return result.stdout.strip()
+    except FileNotFoundError:
+        return ""
+
+
+def docker_exec(container, argv, interactive=False):
+    """Execute command in a docker container.
+
+    argv is the command as a list, e.g. ["asterisk", "-rx", "core show help"].
+    """
     if interactive:
-        os.system(f"docker exec -it {container} {cmd}")
+        subprocess.run(["docker", "exec", "-it", container, *argv])
         return ""
-    return run_cmd(f"docker exec {container} {cmd}")
+    return run_argv(["docker", "exec", container, *argv])
 
 
 def get_running_containers():
     """Get list of running voipbin containers"""
-    output = run_cmd("docker compose ps --format '{{.Name}}' 2>/dev/null")
-    if output:
-        return [c.replace("voipbin-", "") for c in output.split("\n") if c.startswith("voipbin-")]
-    return []
+    return [name.replace("voipbin-", "")
+            for name, _status in get_compose_ps()
+            if name.startswith("voipbin-")]
 
 
+@lru_cache(maxsize=1)
 def get_all_services():
-    """Get list of all services from docker-compose"""
+    """Get list of all services from docker-compose
+
+    The service list only changes when the compose file does, so the
+    `docker compose config` round-trip is memoized for the life of the
+    process. init/update/clean call cache_clear() after mutating the tree.
+    """
     output = run_cmd("docker compose config --services 2>/dev/null")
     return output.split("\n") if output else []
 
@@ -1290,6 +1546,11 @@ DOCKERHUB_RETRY_DELAY = 2
 
 def dockerhub_get(url, retries=DOCKERHUB_RETRY_COUNT):
     """Make a GET request to Docker Hub API with retry logic"""
+    # urllib.request drags in a sizable import chain (http.client, email, …)
+    # and only the update check needs it, so load it on first use like yaml.
+    import urllib.error
+    import urllib.request
+
     for attempt in range(retries):
         try:
             req = urllib.request.Request(url, headers={"Accept": "application/json"})
@@ -1385,6 +1646,7 @@ def resolve_image_tags_parallel(images, progress_callback=None):
 
     Returns: list of results from resolve_image_tag
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     results = []
     total = len(images)
     completed = 0
@@ -1419,6 +1681,8 @@ def get_voipbin_images_from_compose(project_dir="."):
     Returns:
         tuple: (list of unique image names, dict mapping image -> list of service names)
     """
+    import yaml  # deferred: only the update/pin paths pay the parser import
+
     compose_file = os.path.join(project_dir, "docker-compose.yml")
     images = []
     image_to_services = {}  # image -> list of service names
@@ -1452,10 +1716,127 @@ def get_voipbin_images_from_compose(project_dir="."):
 # Sidecar Command Helpers
 # =============================================================================
 
+# Structured log lines emitted by the sidecar binaries are single-line JSON
+# objects whose first key is always "severity", so a prefix check is enough
+# to tell them apart from pretty-printed JSON payload lines.
+_LOG_LINE_PREFIX = '{"severity"'
+
+# Error sniffing for sidecar output that failed to parse as JSON. Compiled
+# case-insensitive patterns avoid lower-casing a potentially large payload
+# twice per failed parse.
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+_ERROR_RE = re.compile(r"error", re.IGNORECASE)
+
+
+# Running-container names change slowly relative to how often status paths
+# poll docker ps; a one-second cache collapses the repeated forks within a
+# single command without ever showing meaningfully stale state.
+_DOCKER_PS_CACHE = {"ts": 0.0, "names": frozenset()}
+_DOCKER_PS_TTL = 1.0
+
+
+# docker compose ps snapshot, shared by the dashboard, status, and update
+# paths so one top-level command makes at most one ~200ms daemon round-trip.
+# start/stop/restart/clean invalidate it explicitly.
+_COMPOSE_PS_CACHE = {"ts": 0.0, "rows": ()}
+_COMPOSE_PS_TTL = 2.0
+
+
+def get_compose_ps():
+    """Return (name, status) rows from docker compose ps, cached for ~2s."""
+    now = time.time()
+    if now - _COMPOSE_PS_CACHE["ts"] >= _COMPOSE_PS_TTL:
+        output = run_cmd("docker compose ps --format '{{.Name}}\t{{.Status}}' 2>/dev/null")
+        rows = []
+        if output:
+            for line in output.strip().split("\n"):
+                parts = line.split("\t")
+                if len(parts) >= 2:
+                    rows.append((parts[0], parts[1]))
+        _COMPOSE_PS_CACHE["rows"] = tuple(rows)
+        _COMPOSE_PS_CACHE["ts"] = now
+    return _COMPOSE_PS_CACHE["rows"]
+
+
+def invalidate_compose_ps_cache():
+    """Drop the compose ps snapshot after starting/stopping containers."""
+    _COMPOSE_PS_CACHE["ts"] = 0.0
+
+
+def stream_compose_pull(tail_lines=10, echo=True):
+    """Run docker compose pull, keeping only the last few output lines.
+
+    Streams the output instead of buffering it, so memory stays bounded on
+    large pulls. With echo=True progress lines are printed as they arrive.
+    Returns the retained tail as a list.
+    """
+    tail = deque(maxlen=tail_lines)
+    proc = subprocess.Popen(["docker", "compose", "pull"],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    for line in proc.stdout:
+        line = line.rstrip("\n")
+        tail.append(line)
+        if echo:
+            print(f"  {line}", flush=True)
+    proc.wait()
+    return list(tail)
+
+
+# Existence probes for paths that only change when setup scripts run
+# (resolver config, the scripts themselves). Cached briefly so status
+# loops don't stat the same paths over and over.
+_PATH_EXISTS_CACHE = {}
+_PATH_EXISTS_TTL = 5.0
+
+
+def path_exists_cached(path):
+    """os.path.exists with a short-lived per-path cache."""
+    now = time.time()
+    entry = _PATH_EXISTS_CACHE.get(path)
+    if entry and now - entry[1] < _PATH_EXISTS_TTL:
+        return entry[0]
+    exists = os.path.exists(path)
+    _PATH_EXISTS_CACHE[path] = (exists, now)
+    return exists
+
+
+# Patterns for parsing ip(8) output in-process instead of piping through
+# grep -oP per probe.
+_INET_RE = re.compile(r"inet ([\d./]+)")
+_DEV_RE = re.compile(r"dev (\S+)")
+
+
+@lru_cache(maxsize=32)
+def _run_cached(cmd):
+    """Memoized read-only probe, repeated within one command render.
+
+    Accepts either a shell string (run_cmd) or an argv tuple (run_argv,
+    no shell fork). Callers clear the cache at the start of their render so
+    each invocation sees fresh system state; within a render, identical
+    probes (ip route, ip addr, docker network inspect) only run once.
+    """
+    if isinstance(cmd, tuple):
+        return run_argv(list(cmd), merge_stderr=False)
+    return run_cmd(cmd)
+
+
+def get_running_container_names():
+    """Return the set of running container names (cached for ~1s)."""
+    now = time.time()
+    if now - _DOCKER_PS_CACHE["ts"] >= _DOCKER_PS_TTL:
+        output = run_argv(["docker", "ps", "--format", "{{.Names}}"], merge_stderr=False)
+        _DOCKER_PS_CACHE["names"] = frozenset(output.split()) if output else frozenset()
+        _DOCKER_PS_CACHE["ts"] = now
+    return _DOCKER_PS_CACHE["names"]
+
+
 def check_container_running(container):
     """Check if a container is running"""
-    output = run_cmd(f"docker ps --filter 'name={container}' --format '{{{{.Names}}}}'")
-    return container in output if output else False
+    # docker inspect hits one container record directly; docker ps with a
+    # name filter walks every running container and does substring matching
+    output = run_cmd(f"docker inspect -f '{{{{.State.Running}}}}' {container} 2>/dev/null")
+    return output == "true"
 
 
 def run_sidecar_command(container, binary, args, verbose=False):
@@ -1464,21 +1845,26 @@ def run_sidecar_command(container, binary, args, verbose=False):
     Returns (success, data_or_error) tuple.
     data_or_error is parsed JSON on success, error message on failure.
     """
-    # Check container is running
-    if not check_container_running(container):
-        return False, f"Service unavailable: {container} is not running.\n  Run 'start' to launch services."
-
+    from concurrent.futures import ThreadPoolExecutor
     # Build command
     args_str = " ".join(f'--{k} "{v}"' if isinstance(v, str) and " " in v else f"--{k} {v}"
                         for k, v in args.items() if v is not None)
     cmd = f'docker exec {container} {binary} {args_str} 2>&1'
 
-    output = run_cmd(cmd)
+    # Run the aliveness check and the exec concurrently instead of paying
+    # two docker round-trips back to back. If the container turns out to be
+    # down, the exec fails fast on its own and its output is discarded.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        running_future = pool.submit(check_container_running, container)
+        output_future = pool.submit(run_cmd, cmd)
+        if not running_future.result():
+            return False, f"Service unavailable: {container} is not running.\n  Run 'start' to launch services."
+        output = output_future.result()
     if not output:
         return True, []
 
     # Parse output - filter log lines, info lines, and extract JSON
-    lines = output.split("\n")
+    lines = output.splitlines()
     json_lines = []
     log_lines = []
     info_lines = []
@@ -1487,16 +1873,19 @@ def run_sidecar_command(container, binary, args, verbose=False):
         stripped = line.strip()
         if not stripped:
             continue
-        # Check if it's a log line (JSON with severity field)
-        if stripped.startswith("{") and '"severity"' in stripped:
-            log_lines.append(stripped)
+        # Check if it's a log line (JSON with leading severity field)
+        if stripped.startswith(_LOG_LINE_PREFIX):
+            # Log/info lines are only ever shown in verbose mode - don't
+            # collect them otherwise
+            if verbose:
+                log_lines.append(stripped)
         # Check if it's JSON data (starts with { or [ or is part of JSON array/object)
         elif stripped.startswith("{") or stripped.startswith("[") or stripped.startswith('"') or stripped == "]" or stripped == "}," or stripped == "}":
             json_lines.append(line)  # Keep original indentation for JSON
         # Check if it's an indented JSON line (part of pretty-printed JSON)
         elif line.startswith("  ") and ('"' in stripped or stripped in ["{", "}", "},", "]", "],"]):
             json_lines.append(line)
-        else:
+        elif verbose:
             # Info/status line (e.g., "Retrieving extensions...")
             info_lines.append(stripped)
 
@@ -1504,7 +1893,7 @@ def run_sidecar_command(container, binary, args, verbose=False):
     if verbose:
         for log_line in log_lines:
             try:
-                log = json.loads(log_line)
+                log = _json_loads(log_line)
                 severity = log.get("severity", "INFO")
                 message = log.get("message", "")
                 if severity == "ERROR":
@@ -1513,7 +1902,7 @@ def run_sidecar_command(container, binary, args, verbose=False):
                     print(f"{gray('[DEBUG]')} {message}")
                 else:
                     print(f"[{severity}] {message}")
-            except json.JSONDecodeError:
+            except ValueError:
                 print(log_line)
         for info_line in info_lines:
             print(f"{gray('[INFO]')} {info_line}")
@@ -1526,13 +1915,13 @@ def run_sidecar_command(container, binary, args, verbose=False):
         return True, []
 
     try:
-        data = json.loads(json_str)
+        data = _json_loads(json_str)
         return True, data
-    except json.JSONDecodeError:
+    except ValueError:
         # Check for common error patterns
-        if "not found" in json_str.lower():
+        if _NOT_FOUND_RE.search(json_str):
             return False, "Resource not found."
-        if "error" in json_str.lower():
+        if _ERROR_RE.search(json_str):
             return False, json_str
         return False, f"Invalid response: {json_str}"
 
@@ -1543,20 +1932,22 @@ def parse_sidecar_args(args):
     Returns dict of flag -> value.
     """
     result = {}
+    n = len(args)
     i = 0
-    while i < len(args):
+    while i < n:
         arg = args[i]
-        if arg.startswith("--"):
-            key = arg[2:]
-            # Check if next arg is a value (not another flag)
-            if i + 1 < len(args) and not args[i + 1].startswith("--"):
-                result[key] = args[i + 1]
-                i += 2
-            else:
-                result[key] = True
-                i += 1
-        else:
+        i += 1
+        if not arg.startswith("--"):
+            continue
+        # Support both "--flag value" and "--flag=value"
+        key, sep, value = arg[2:].partition("=")
+        if sep:
+            result[key] = value
+        elif i < n and not args[i].startswith("--"):
+            result[key] = args[i]
             i += 1
+        else:
+            result[key] = True
     return result
 
 
@@ -1565,11 +1956,20 @@ def prompt_missing_args(command_key, provided_args):
     Check for missing required args and prompt for them.
     Returns updated args dict or None if cancelled.
     """
-    required = SIDECAR_REQUIRED_ARGS.get(command_key, [])
+    required = SIDECAR_REQUIRED_ARGS.get(command_key)
+    if not required:
+        return provided_args
+
+    # Fast path: everything already supplied - no copy, no prompting
+    provided = {k for k, v in provided_args.items() if v is not None}
+    if _REQUIRED_ARG_SETS[command_key] <= provided:
+        return provided_args
+    missing = [arg for arg in required if arg not in provided]
+
     updated_args = provided_args.copy()
 
-    for arg in required:
-        if arg not in updated_args or updated_args[arg] is None:
+    for arg in missing:
+        if updated_args.get(arg) is None:
             print(f"\nMissing required argument: {yellow('--' + arg)}\n")
             try:
                 value = input(f"Enter {arg}: ").strip()
@@ -1596,16 +1996,17 @@ def confirm_delete(resource_type, resource_data):
     Show delete confirmation dialog.
     Returns True if confirmed, False otherwise.
     """
-    print(f"\n{yellow('⚠')} Delete {resource_type}?")
+    out = [f"\n{yellow('⚠')} Delete {resource_type}?"]
 
     # Show resource details
     if isinstance(resource_data, dict):
-        for key in ["name", "email", "number", "id"]:
-            if key in resource_data and resource_data[key]:
-                display_key = key.replace("_", " ").title()
-                print(f"  {display_key}:  {resource_data[key]}")
+        for key in ("name", "email", "number", "id"):
+            value = resource_data.get(key)
+            if value:
+                out.append(f"  {key.replace('_', ' ').title()}:  {value}")
 
-    print(f"\n  {red('This action cannot be undone.')}\n")
+    out.append(f"\n  {red('This action cannot be undone.')}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
     try:
         confirm = input("Type 'yes' to confirm: ").strip().lower()
@@ -1626,22 +2027,32 @@ def format_table(data, columns):
     if not data:
         return
 
-    # Calculate column widths (at least header width)
-    col_widths = []
-    for display_name, json_key, default_width in columns:
-        max_val_width = max((len(str(row.get(json_key, ""))) for row in data), default=0)
-        col_widths.append(max(len(display_name), min(max_val_width, default_width)))
-
-    # Print header
+    # Calculate column widths (at least header width) in a single pass over
+    # the rows, keeping a running max per column instead of re-walking the
+    # data once per column
+    keys = [json_key for _, json_key, _ in columns]
+    val_widths = [0] * len(columns)
+    for row in data:
+        for i, key in enumerate(keys):
+            width = len(str(row.get(key, "")))
+            if width > val_widths[i]:
+                val_widths[i] = width
+    col_widths = [max(len(display_name), min(val_widths[i], default_width))
+                  for i, (display_name, _, default_width) in enumerate(columns)]
+
+    # Build output in memory, then emit with a single write (one syscall
+    # instead of one per row, which matters for large listings)
     header = "  ".join(display_name.ljust(col_widths[i])
                        for i, (display_name, _, _) in enumerate(columns))
     separator = "  ".join("─" * w for w in col_widths)
 
-    print(separator)
-    print(header)
-    print(separator)
+    out = [separator, header, separator]
+
+    # For very large listings, flush in chunks so the first rows appear
+    # while the rest are still being formatted, without giving up the
+    # batched-write win for the common short list.
+    flush_every = 500
 
-    # Print rows
     for row in data:
         values = []
         for i, (_, json_key, _) in enumerate(columns):
@@ -1652,34 +2063,67 @@ def format_table(data, columns):
                 val = f"{val:.2f}"
             val_str = str(val)[:col_widths[i]].ljust(col_widths[i])
             values.append(val_str)
-        print("  ".join(values))
+        out.append("  ".join(values))
+        if len(out) >= flush_every:
+            sys.stdout.write("\n".join(out) + "\n")
+            out = []
 
-    print(separator)
+    out.append(separator)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def format_details(data, fields):
     """
     Format a single dict as key-value pairs.
-    fields: list of (display_name, json_key)
+    fields: list of (display_name, json_key, is_timestamp)
     """
     if not data:
         return
 
     # Find max label width
-    max_label = max(len(display_name) for display_name, _ in fields)
+    max_label = max(len(display_name) for display_name, _, _ in fields)
 
-    print("─" * 40)
-    for display_name, json_key in fields:
+    out = ["─" * 40]
+    for display_name, json_key, is_timestamp in fields:
         val = data.get(json_key, "")
         if val is None or val == "":
             val = "-"
         elif isinstance(val, float):
             val = f"{val:.2f}"
         # Truncate timestamps
-        if "tm_" in json_key and isinstance(val, str) and len(val) > 19:
+        if is_timestamp and isinstance(val, str) and len(val) > 19:
             val = val[:19]
-        print(f"  {display_name}:{' ' * (max_label - len(display_name) + 2)}{val}")
-    print()
+        out.append(f"  {display_name}:{' ' * (max_label - len(display_name) + 2)}{val}")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Translation table beats chained str.replace for the action-label derivation,
+# and the labels repeat across help screens so they are memoized too.
+_DASH_TO_SPACE = str.maketrans("-", " ")
+
+
+@lru_cache(maxsize=256)
+def action_label(cmd):
+    """Human-readable label for an action name ("update-password" -> "Update Password")."""
+    return cmd.translate(_DASH_TO_SPACE).title()
+
+
+def print_action_help(desc, usage, required, optional):
+    """
+    Render an action help block (description, usage, required/optional args).
+    Buffered into one write like the other formatters.
+    """
+    parts = [f"\n{bold(desc)}\n\n", f"{blue('Usage:')} {usage}\n\n"]
+    if required:
+        parts.append(f"{blue('Required:')}\n")
+        parts.extend(f"  --{arg:<20} {arg_desc}\n" for arg, arg_desc in required)
+        parts.append("\n")
+    if optional:
+        parts.append(f"{blue('Optional:')}\n")
+        parts.extend(f"  --{arg:<20} {arg_desc}\n" for arg, arg_desc in optional)
+        parts.append("\n")
+    sys.stdout.write("".join(parts))
 
 
 # =============================================================================
@@ -1687,67 +2131,94 @@ def format_details(data, fields):
 # =============================================================================
 
 class VoIPBinCLI:
+    # Command name -> handler method name. Shared at class scope so the
+    # table is defined once; __init__ only binds the methods.
+    _COMMAND_METHODS = {
+        "help": "cmd_help",
+        "?": "cmd_help",
+        "status": "cmd_status",
+        "ps": "cmd_status",
+        "start": "cmd_start",
+        "stop": "cmd_stop",
+        "restart": "cmd_restart",
+        "logs": "cmd_logs",
+        "ast": "cmd_ast",
+        "asterisk": "cmd_ast",
+        "kam": "cmd_kam",
+        "kamailio": "cmd_kam",
+        "db": "cmd_db",
+        "mysql": "cmd_db",
+        "api": "cmd_api",
+        "ext": "cmd_ext",
+        "extension": "cmd_ext",
+        "billing": "cmd_billing",
+        "customer": "cmd_customer",
+        "number": "cmd_number",
+        "registrar": "cmd_registrar",
+        "agent": "cmd_agent",
+        "call": "cmd_call",
+        "campaign": "cmd_campaign",
+        "chat": "cmd_chat",
+        "conference": "cmd_conference",
+        "conversation": "cmd_conversation",
+        "flow": "cmd_flow",
+        "outdial": "cmd_outdial",
+        "queue": "cmd_queue",
+        "route": "cmd_route",
+        "storage": "cmd_storage",
+        "tag": "cmd_tag",
+        "talk": "cmd_talk",
+        "transfer": "cmd_transfer",
+        "tts": "cmd_tts",
+        "webhook": "cmd_webhook",
+        "config": "cmd_config",
+        "dns": "cmd_dns",
+        "certs": "cmd_certs",
+        "network": "cmd_network",
+        "init": "cmd_init",
+        "clean": "cmd_clean",
+        "update": "cmd_update",
+        "rollback": "cmd_rollback",
+        "version": "cmd_version",
+        "exit": "cmd_exit",
+        "quit": "cmd_exit",
+        "clear": "cmd_clear",
+    }
+
     def __init__(self):
         self.config = Config()
         self.context = None  # None = top-level, or "asterisk", "kamailio", "db", "api"
-        self.api_token = None
+        self.api_token = self._load_cached_token()
         self.running = True
+        self._env_cache = None  # (mtime_ns, dict) for .env lookups
+        self._last_listed = {}  # (service, subcmd) -> {id: (item, ts)} list cache
+        self._db_conn = None  # persistent PyMySQL connection (lazy, optional)
+        self._coredns_check = None  # (running, ts) CoreDNS container check
+        self._dns_sequential = False  # --sequential debug flag for dns checks
+        self._dns_resolver = False  # dnspython resolver (False = not built yet)
+        self._api_conn = None  # persistent HTTPS connection to the API
+        self._api_conn_addr = None  # (host, port) the connection was opened to
 
         # Disable colors if configured
         if not self.config.get("colors", True):
             Colors.disable()
 
-        # Command handlers
-        self.commands = {
-            "help": self.cmd_help,
-            "?": self.cmd_help,
-            "status": self.cmd_status,
-            "ps": self.cmd_status,
-            "start": self.cmd_start,
-            "stop": self.cmd_stop,
-            "restart": self.cmd_restart,
-            "logs": self.cmd_logs,
-            "ast": self.cmd_ast,
-            "asterisk": self.cmd_ast,
-            "kam": self.cmd_kam,
-            "kamailio": self.cmd_kam,
-            "db": self.cmd_db,
-            "mysql": self.cmd_db,
-            "api": self.cmd_api,
-            "ext": self.cmd_ext,
-            "extension": self.cmd_ext,
-            "billing": self.cmd_billing,
-            "customer": self.cmd_customer,
-            "number": self.cmd_number,
-            "registrar": self.cmd_registrar,
-            "agent": self.cmd_agent,
-            "call": self.cmd_call,
-            "campaign": self.cmd_campaign,
-            "chat": self.cmd_chat,
-            "conference": self.cmd_conference,
-            "conversation": self.cmd_conversation,
-            "flow": self.cmd_flow,
-            "outdial": self.cmd_outdial,
-            "queue": self.cmd_queue,
-            "route": self.cmd_route,
-            "storage": self.cmd_storage,
-            "tag": self.cmd_tag,
-            "talk": self.cmd_talk,
-            "transfer": self.cmd_transfer,
-            "tts": self.cmd_tts,
-            "webhook": self.cmd_webhook,
-            "config": self.cmd_config,
-            "dns": self.cmd_dns,
-            "certs": self.cmd_certs,
-            "network": self.cmd_network,
-            "init": self.cmd_init,
-            "clean": self.cmd_clean,
-            "update": self.cmd_update,
-            "rollback": self.cmd_rollback,
-            "version": self.cmd_version,
-            "exit": self.cmd_exit,
-            "quit": self.cmd_exit,
-            "clear": self.cmd_clear,
+        # Prompt strings are static per context - build them once, after the
+        # colors setting is applied, instead of on every REPL iteration
+        self._top_prompt = self._make_prompt(None)
+        self._context_prompts = {ctx: self._make_prompt(ctx)
+                                 for ctx in ("asterisk", "kamailio", "db", "api")}
+
+        # Command handlers, bound from the class-level table
+        self.commands = {name: getattr(self, method)
+                         for name, method in self._COMMAND_METHODS.items()}
+
+        # Passthrough context handlers (see run_in_context)
+        self._context_handlers = {
+            "asterisk": self.asterisk_cmd,
+            "kamailio": self.kamailio_cmd,
+            "db": self.db_cmd,
+            "api": self.api_cmd,
         }
 
         # Help text for commands
@@ -1797,6 +2268,24 @@ class VoIPBinCLI:
             "clear": ("Clear screen", "clear"),
         }
 
+    def _load_env(self):
+        """Parse .env into a dict, cached on the file's mtime.
+
+        Commands like status previously shelled out one grep|cut|head
+        pipeline per variable; this reads the file once and reuses the
+        parsed dict until .env changes on disk.
+        """
+        try:
+            mtime = os.stat(".env").st_mtime_ns
+        except OSError:
+            return {}
+        if self._env_cache and self._env_cache[0] == mtime:
+            return self._env_cache[1]
+
+        env = _parse_env_file()
+        self._env_cache = (mtime, env)
+        return env
+
     def get_prompt(self):
         """Get the current prompt string
 
@@ -1804,20 +2293,24 @@ class VoIPBinCLI:
         ANSI escape codes so readline correctly calculates prompt length.
         Without these markers, cursor movement breaks after history lookup.
         """
-        # Readline-safe escape sequences
+        if self.context:
+            prompt = self._context_prompts.get(self.context)
+            if prompt is None:
+                prompt = self._make_prompt(self.context)
+                self._context_prompts[self.context] = prompt
+            return prompt
+        return self._top_prompt
+
+    @staticmethod
+    def _make_prompt(context):
+        """Build a readline-safe prompt string for a context (or top level)"""
         rl_bold = f"\001{Colors.BOLD}\002"
         rl_blue = f"\001{Colors.BLUE}\002"
         rl_reset = f"\001{Colors.RESET}\002"
-
-        if self.context:
-            ctx_name = {
-                "asterisk": "asterisk",
-                "kamailio": "kam",
-                "db": "db",
-                "api": "api"
-            }.get(self.context, self.context)
-            return f"{rl_bold}voipbin{rl_reset}({rl_blue}{ctx_name}{rl_reset})> "
-        return f"{rl_bold}voipbin{rl_reset}> "
+        if context is None:
+            return f"{rl_bold}voipbin{rl_reset}> "
+        ctx_name = {"kamailio": "kam"}.get(context, context)
+        return f"{rl_bold}voipbin{rl_reset}({rl_blue}{ctx_name}{rl_reset})> "
 
     def parse_input(self, line):
         """Parse input line into command and arguments"""
@@ -1825,6 +2318,11 @@ class VoIPBinCLI:
         if not line:
             return None, []
 
+        # Fast path: bare single-word commands (status, help, exit, ...)
+        # don't need shlex quote handling
+        if " " not in line and "\t" not in line and "'" not in line and '"' not in line and "\\" not in line:
+            return line.lower(), []
+
         try:
             parts = shlex.split(line)
         except ValueError:
@@ -1832,20 +2330,23 @@ class VoIPBinCLI:
 
         return parts[0].lower(), parts[1:]
 
+    # Words that leave a passthrough context
+    _CONTEXT_EXIT_WORDS = frozenset(("exit", "quit", ".."))
+
     def run_in_context(self, line):
-        """Handle input when in a context"""
-        if line.lower() in ("exit", "quit", ".."):
+        """Handle input when in a context.
+
+        Context input is passed through verbatim (no shlex tokenization) -
+        Asterisk/Kamailio/SQL lines keep their own quoting. Only the short
+        exit words are recognized here.
+        """
+        if line.strip().lower() in self._CONTEXT_EXIT_WORDS:
             self.context = None
             return
 
-        if self.context == "asterisk":
-            self.asterisk_cmd(line)
-        elif self.context == "kamailio":
-            self.kamailio_cmd(line)
-        elif self.context == "db":
-            self.db_cmd(line)
-        elif self.context == "api":
-            self.api_cmd(line)
+        handler = self._context_handlers.get(self.context)
+        if handler:
+            handler(line)
 
     # -------------------------------------------------------------------------
     # Command Handlers
@@ -1925,65 +2426,35 @@ Type 'help <command>' for detailed usage.
 
     def cmd_status(self, args):
         """Show service status"""
-        output = run_cmd("docker compose ps --format '{{.Name}}\t{{.Status}}' 2>/dev/null")
-        if not output:
+        rows = get_compose_ps()
+        if not rows:
             print(yellow("No services running. Run 'start' to start services."))
             return
 
-        # Get host IP for endpoints
-        host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "localhost"
+        # Get host IP for endpoints (one parse of .env for the whole command)
+        env = self._load_env()
+        host_ip = env.get("HOST_EXTERNAL_IP") or "localhost"
 
-        # Parse services into a dict
+        # Parse services in one pass: (status, classification) per service,
+        # so the rendering below never re-lowercases a status
         services = {}
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                name = parts[0].replace("voipbin-", "")
-                status = parts[1]
-                services[name] = status
-
-        # Key services with endpoints (service_name: (label, endpoint, credentials))
-        # Web services use Docker port mapping on HOST_IP
-        endpoint_services = {
-            "admin": ("Admin Console", "http://admin.voipbin.test:3003", None),
-            "api-mgr": ("API Manager", "https://api.voipbin.test:8443", None),
-            "mq": ("RabbitMQ", "http://localhost:15672", "guest / guest"),
-            "db": ("MySQL", "localhost:3306", "root / root_password"),
-        }
-
-        # SIP/VoIP endpoints (shown separately)
-        voip_endpoints = {
-            "kamailio": [
-                ("SIP (UDP/TCP)", f"{host_ip}:5060"),
-                ("SIP (TLS)", f"{host_ip}:5061"),
-                ("SIP (WSS)", f"wss://{host_ip}:443"),
-            ],
-            "rtpengine": [("RTPEngine", f"{host_ip}:22222")],
-            "ast-registrar": [("Asterisk Registrar", f"{host_ip}:5082")],
-            "ast-call": [("Asterisk Call", f"{host_ip}:5080")],
-        }
+        for name, status in rows:
+            name = name.replace("voipbin-", "")
+            services[name] = (status, classify_status(status))
 
         # Count running services
-        running = sum(1 for s in services.values() if "up" in s.lower())
+        running = sum(1 for _, cls in services.values() if cls == "up")
         total = len(services)
 
-        # Helper to get status icon
+        # Helper to get status icon via the shared dispatch table
         def get_status_icon(svc_name):
-            status = services.get(svc_name, "")
-            if "up" in status.lower():
-                return green("●")
-            elif "restarting" in status.lower():
-                return yellow("◐")
-            elif status:
-                return red("○")
-            return gray("○")
+            _, cls = services.get(svc_name, ("", "unknown"))
+            return _STATUS_ICONS[cls]()
 
         # Print Web/Management endpoints
         print(f"\n{bold('Web Interfaces')}")
         print("-" * 70)
-        for svc_name, (label, endpoint, creds) in endpoint_services.items():
+        for svc_name, (label, endpoint, creds) in _ENDPOINT_SERVICES.items():
             line = f"  {get_status_icon(svc_name)} {label:<20} {blue(endpoint)}"
             if creds:
                 line += f"  {gray('(' + creds + ')')}"
@@ -1992,9 +2463,10 @@ Type 'help <command>' for detailed usage.
         # Print VoIP endpoints
         print(f"\n{bold('VoIP Endpoints')}")
         print("-" * 70)
-        for svc_name, endpoints in voip_endpoints.items():
+        for svc_name, endpoints in _VOIP_ENDPOINTS.items():
             status_icon = get_status_icon(svc_name)
             for i, (label, endpoint) in enumerate(endpoints):
+                endpoint = endpoint.format(host=host_ip)
                 if i == 0:
                     print(f"  {status_icon} {label:<20} {blue(endpoint)}")
                 else:
@@ -2009,27 +2481,22 @@ Type 'help <command>' for detailed usage.
         warning_svcs = []
         stopped_svcs = []
 
-        # Services already shown in endpoints sections
-        shown_services = set(endpoint_services.keys()) | set(voip_endpoints.keys())
-
-        for name, status in sorted(services.items()):
-            if name in shown_services:
+        for name, (status, cls) in sorted(services.items()):
+            if name in _SHOWN_SERVICES:
                 continue  # Already shown above
-            if "up" in status.lower():
+            if cls == "up":
                 running_svcs.append(name)
-            elif "restarting" in status.lower():
+            elif cls == "restarting":
                 warning_svcs.append((name, status))
             else:
                 stopped_svcs.append((name, status))
 
-        # Show running services compactly (3 per line)
+        # Show running services compactly (3 per line), as one joined print
+        # instead of an unbuffered print(end="") per name
         if running_svcs:
-            print(f"  {green('●')} Running: ", end="")
-            for i, name in enumerate(running_svcs):
-                if i > 0 and i % 3 == 0:
-                    print(f"\n             ", end="")
-                print(f"{name:<20}", end="")
-            print()
+            rows = ["".join(f"{name:<20}" for name in running_svcs[i:i + 3])
+                    for i in range(0, len(running_svcs), 3)]
+            print(f"  {GREEN_CIRCLE} Running: " + "\n             ".join(rows))
 
         # Show warning services
         for name, status in warning_svcs:
@@ -2037,115 +2504,71 @@ Type 'help <command>' for detailed usage.
 
         # Show stopped services
         for name, status in stopped_svcs:
-            print(f"  {red('○')} {name}: {red(status)}")
+            print(f"  {RED_CIRCLE} {name}: {red(status)}")
 
-        # Show configuration status
-        print(f"\n{bold('Configuration')}")
-        print("-" * 60)
+        # Show configuration status - table-driven provider checks, built
+        # into a buffer and emitted with one write
 
-        # Helper to check env var
+        # Helper to check env var against the cached .env dict
         def get_env_var(var_name):
-            result = run_cmd(f"grep '^{var_name}=' .env 2>/dev/null | cut -d'=' -f2 | head -1")
-            return result.strip() if result else ""
+            return env.get(var_name, "").strip()
+
+        def provider_line(label, configured, note=None):
+            padded = (label + ":").ljust(20)
+            if configured:
+                line = f"  {GREEN_CIRCLE} {padded}{green('configured')}"
+                if note:
+                    line += f" {gray(note)}"
+                return line
+            return f"  {GRAY_CIRCLE} {padded}{gray('not set')}"
 
-        # Check GCP credentials
+        out = [f"\n{bold('Configuration')}", "-" * 60]
+
+        # GCP credentials get special handling for the dummy placeholder
         gcp_creds_path = get_env_var("GOOGLE_APPLICATION_CREDENTIALS")
         if gcp_creds_path:
-            # Check if it's the dummy file
-            is_dummy = False
-            if "dummy" in gcp_creds_path.lower():
-                is_dummy = True
-            elif os.path.exists(gcp_creds_path):
-                # Check file contents for dummy marker
-                try:
-                    with open(gcp_creds_path, 'r') as f:
-                        content = f.read()
-                        if "dummy-project" in content:
-                            is_dummy = True
-                except:
-                    pass
-
-            if is_dummy:
-                print(f"  {yellow('!')} GCP Credentials:    {yellow('dummy')} {gray('(TTS/storage disabled)')}")
+            if _is_dummy_gcp_credentials(gcp_creds_path):
+                out.append(f"  {YELLOW_BANG} GCP Credentials:    {yellow('dummy')} {gray('(TTS/storage disabled)')}")
             else:
-                print(f"  {green('●')} GCP Credentials:    {green('configured')}")
+                out.append(f"  {GREEN_CIRCLE} GCP Credentials:    {green('configured')}")
         else:
-            print(f"  {gray('○')} GCP Credentials:    {gray('not set')}")
+            out.append(f"  {GRAY_CIRCLE} GCP Credentials:    {gray('not set')}")
 
         # AI Services
-        openai_key = get_env_var("OPENAI_API_KEY")
-        if openai_key:
-            print(f"  {green('●')} OpenAI:             {green('configured')}")
-        else:
-            print(f"  {gray('○')} OpenAI:             {gray('not set')}")
-
-        # Check other AI services (group them)
-        ai_services = []
-        if get_env_var("DEEPGRAM_API_KEY"):
-            ai_services.append("Deepgram")
-        if get_env_var("CARTESIA_API_KEY"):
-            ai_services.append("Cartesia")
-        if get_env_var("ELEVENLABS_API_KEY"):
-            ai_services.append("ElevenLabs")
+        out.append(provider_line("OpenAI", get_env_var("OPENAI_API_KEY")))
 
+        ai_services = [name for name, var in _AI_SERVICE_VARS if get_env_var(var)]
         if ai_services:
-            print(f"  {green('●')} AI Services:        {green(', '.join(ai_services))}")
-
-        # Telephony Providers
-        print(f"\n  {bold('Telephony')}")
+            out.append(f"  {GREEN_CIRCLE} AI Services:        {green(', '.join(ai_services))}")
 
-        twilio_sid = get_env_var("TWILIO_SID")
-        twilio_key = get_env_var("TWILIO_API_KEY")
-        if twilio_sid and twilio_key:
-            print(f"  {green('●')} Twilio:             {green('configured')}")
-        else:
-            print(f"  {gray('○')} Twilio:             {gray('not set')}")
-
-        telnyx_key = get_env_var("TELNYX_API_KEY")
-        if telnyx_key:
-            print(f"  {green('●')} Telnyx:             {green('configured')}")
-        else:
-            print(f"  {gray('○')} Telnyx:             {gray('not set')}")
-
-        # Email Providers
-        print(f"\n  {bold('Email')}")
-
-        sendgrid_key = get_env_var("SENDGRID_API_KEY")
-        if sendgrid_key:
-            print(f"  {green('●')} SendGrid:           {green('configured')}")
-        else:
-            print(f"  {gray('○')} SendGrid:           {gray('not set')}")
-
-        mailgun_key = get_env_var("MAILGUN_API_KEY")
-        if mailgun_key:
-            print(f"  {green('●')} Mailgun:            {green('configured')}")
-        else:
-            print(f"  {gray('○')} Mailgun:            {gray('not set')}")
+        # Remaining providers come straight from the table
+        for section, label, env_vars, note in _PROVIDER_CHECKS:
+            if section:
+                out.append(f"\n  {bold(section)}")
+            out.append(provider_line(label, all(get_env_var(v) for v in env_vars), note))
 
-        # AWS (transcription)
-        print(f"\n  {bold('Cloud Services')}")
-
-        aws_access = get_env_var("AWS_ACCESS_KEY")
-        aws_secret = get_env_var("AWS_SECRET_KEY")
-        if aws_access and aws_secret:
-            print(f"  {green('●')} AWS:                {green('configured')} {gray('(transcription)')}")
-        else:
-            print(f"  {gray('○')} AWS:                {gray('not set')}")
+        sys.stdout.write("\n".join(out) + "\n")
 
         # DNS Configuration
         print(f"\n{bold('DNS Domains')} (*.voipbin.test → {host_ip})")
         print("-" * 60)
 
-        # Check if CoreDNS is running and DNS is configured
-        coredns_running = "voipbin-dns" in run_cmd("docker ps --format '{{.Names}}' 2>/dev/null")
-        dns_configured = "nameserver 127.0.0.1" in run_cmd("cat /etc/resolv.conf 2>/dev/null")
+        # Check if CoreDNS is running and DNS is configured. The compose ps
+        # output parsed above already covers voipbin-dns - no extra docker
+        # round-trip needed - and resolv.conf is read in-process.
+        coredns_running = services.get("dns", ("", "unknown"))[1] == "up"
+        try:
+            with open("/etc/resolv.conf") as f:
+                dns_configured = "nameserver 127.0.0.1" in f.read()
+        except OSError:
+            dns_configured = False
 
         if coredns_running and dns_configured:
-            print(f"  {green('●')} DNS Status: {green('active')}")
+            print(f"  {GREEN_CIRCLE} DNS Status: {green('active')}")
         elif coredns_running:
-            print(f"  {yellow('!')} DNS Status: {yellow('CoreDNS running, but resolv.conf not configured')}")
+            print(f"  {YELLOW_BANG} DNS Status: {yellow('CoreDNS running, but resolv.conf not configured')}")
         else:
-            print(f"  {red('○')} DNS Status: {red('CoreDNS not running')}")
+            print(f"  {RED_CIRCLE} DNS Status: {red('CoreDNS not running')}")
 
         print(f"\n  {bold('Web Services')} (Docker port mapping on {host_ip})")
         print(f"    https://api.voipbin.test:8443     API Manager")
@@ -2165,6 +2588,7 @@ Type 'help <command>' for detailed usage.
 
     def _create_initial_version_pins(self, project_dir):
         """Create initial version pins on first start"""
+        import shutil
         override_file = os.path.join(project_dir, "docker-compose.override.yml")
         versions_dir = os.path.join(project_dir, ".voipbin-versions")
 
@@ -2203,7 +2627,7 @@ Type 'help <command>' for detailed usage.
             print(yellow("  No images resolved. Will use :latest tags."))
             return
 
-        print(f"  {green('✓')} Resolved {len(resolved)}/{len(images)} images")
+        print(f"  {GREEN_CHECK} Resolved {len(resolved)}/{len(images)} images")
 
         # Generate override file
         override_content = self._generate_override_content(resolved, warnings, image_to_services)
@@ -2216,8 +2640,8 @@ Type 'help <command>' for detailed usage.
         history_file = os.path.join(versions_dir, f"{timestamp}.yml")
         shutil.copy2(override_file, history_file)
 
-        print(f"  {green('✓')} Version pins created")
-        print(f"  {green('✓')} Saved to rollback history")
+        print(f"  {GREEN_CHECK} Version pins created")
+        print(f"  {GREEN_CHECK} Saved to rollback history")
 
     def cmd_start(self, args):
         """Start services"""
@@ -2230,7 +2654,7 @@ Type 'help <command>' for detailed usage.
         if service:
             # Start specific service
             print(f"Starting {service}...")
-            result = run_cmd(f"docker compose up -d {service} 2>&1")
+            result = run_argv(["docker", "compose", "up", "-d", service])
             if result:
                 print(result)
             print(green("✓ Done"))
@@ -2255,15 +2679,17 @@ Type 'help <command>' for detailed usage.
 
             if os.path.exists(script_path):
                 print("Running full startup (network, DNS, services)...")
-                os.system(script_path)
+                subprocess.run([script_path])
             else:
                 # Fallback to docker compose
                 print("Starting all services...")
-                result = run_cmd("docker compose up -d 2>&1")
+                result = run_argv(["docker", "compose", "up", "-d"])
                 if result:
                     print(result)
                 print(green("✓ Done"))
 
+        invalidate_compose_ps_cache()
+
     def cmd_stop(self, args):
         """Stop services"""
         # Infrastructure services to keep running by default
@@ -2279,14 +2705,14 @@ Type 'help <command>' for detailed usage.
                 print(yellow("Warning: Stopping CoreDNS may cause DNS resolution to fail."))
                 print(yellow("         Run 'dns setup' after restarting to restore DNS."))
             print(f"Stopping {service}...")
-            result = run_cmd(f"docker compose stop {service} 2>&1")
+            result = run_argv(["docker", "compose", "stop", service])
             if result:
                 print(result)
             print(green("✓ Done"))
         elif stop_all:
             # Stop all containers including infrastructure
             print("Stopping all services (including infrastructure)...")
-            result = run_cmd("docker compose stop 2>&1")
+            result = run_argv(["docker", "compose", "stop"])
             if result:
                 print(result)
             print(green("✓ All services stopped"))
@@ -2302,7 +2728,7 @@ Type 'help <command>' for detailed usage.
                         services_to_stop.append(svc)
 
                 if services_to_stop:
-                    result = run_cmd(f"docker compose stop {' '.join(services_to_stop)} 2>&1")
+                    result = run_argv(["docker", "compose", "stop", *services_to_stop])
                     if result:
                         print(result)
                     print(green(f"✓ Stopped {len(services_to_stop)} app services"))
@@ -2312,18 +2738,21 @@ Type 'help <command>' for detailed usage.
             else:
                 print("No services running")
 
+        invalidate_compose_ps_cache()
+
     def cmd_restart(self, args):
         """Restart services"""
         service = args[0] if args else ""
         print(f"Restarting {service or 'all services'}...")
 
         if service:
-            result = run_cmd(f"docker compose restart {service} 2>&1")
+            result = run_argv(["docker", "compose", "restart", service])
         else:
-            result = run_cmd("docker compose restart 2>&1")
+            result = run_argv(["docker", "compose", "restart"])
 
         if result:
             print(result)
+        invalidate_compose_ps_cache()
         print(green("✓ Done"))
 
     def cmd_logs(self, args):
@@ -2348,12 +2777,26 @@ Type 'help <command>' for detailed usage.
         if follow:
             print(f"Following logs for {service}... (Ctrl+C to stop)")
             try:
-                os.system(f"docker compose logs -f --tail={lines} {service}")
+                subprocess.run(["docker", "compose", "logs", "-f", f"--tail={lines}", service])
             except KeyboardInterrupt:
                 print()
         else:
-            result = run_cmd(f"docker compose logs --tail={lines} {service} 2>&1")
-            print(result)
+            # Stream instead of buffering: first lines appear immediately and
+            # a large tail is never held in memory as one string
+            proc = subprocess.Popen(
+                ["docker", "compose", "logs", f"--tail={lines}", service],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            try:
+                for log_line in proc.stdout:
+                    sys.stdout.write(log_line)
+            except KeyboardInterrupt:
+                proc.terminate()
+                print()
+            finally:
+                proc.wait()
 
     def cmd_ast(self, args):
         """Asterisk CLI"""
@@ -2368,7 +2811,7 @@ Type 'help <command>' for detailed usage.
     def asterisk_cmd(self, cmd):
         """Execute Asterisk command"""
         container = self.config.get("asterisk_container")
-        result = docker_exec(container, f'asterisk -rx "{cmd}"')
+        result = docker_exec(container, ["asterisk", "-rx", cmd])
         print(result)
 
     def cmd_kam(self, args):
@@ -2384,7 +2827,7 @@ Type 'help <command>' for detailed usage.
     def kamailio_cmd(self, cmd):
         """Execute Kamailio command"""
         container = self.config.get("kamailio_container")
-        result = docker_exec(container, f'kamcmd {cmd}')
+        result = docker_exec(container, ["kamcmd", *cmd.split()])
         print(result)
 
     def cmd_db(self, args):
@@ -2402,7 +2845,7 @@ Type 'help <command>' for detailed usage.
         """Execute MySQL query"""
         container = self.config.get("db_container")
         password = self.config.get("db_password")
-        result = docker_exec(container, f'mysql -u root -p{password} bin_manager -e "{query}"')
+        result = docker_exec(container, ["mysql", "-u", "root", f"-p{password}", "bin_manager", "-e", query])
         print(result)
 
     def cmd_api(self, args):
@@ -2427,9 +2870,14 @@ Type 'help <command>' for detailed usage.
         cmd = parts[0].lower()
 
         if cmd == "login":
+            import getpass  # deferred: only the interactive login path needs it
             email = parts[1] if len(parts) > 1 else "admin@localhost"
             password = getpass.getpass(f"Password for {email}: ")
             self.api_login(email, password)
+        elif cmd == "logout":
+            self.api_token = None
+            self._clear_cached_token()
+            print(green("✓ Logged out"))
         elif cmd in ("get", "post", "put", "delete"):
             if len(parts) < 2:
                 print(f"Usage: {cmd} <path> [data]")
@@ -2439,28 +2887,98 @@ Type 'help <command>' for detailed usage.
             self.api_request(cmd.upper(), path, data)
         else:
             print(f"Unknown API command: {cmd}")
-            print("Commands: login, get, post, put, delete")
+            print("Commands: login, logout, get, post, put, delete")
+
+    def _load_cached_token(self):
+        """Return the API token cached on disk if it hasn't expired.
+
+        Lets one-shot invocations (voipbin ext list, scripts) skip the
+        implicit re-login that every new process used to pay.
+        """
+        try:
+            with open(TOKEN_FILE) as f:
+                cached = json.load(f)
+            if time.time() - cached.get("ts", 0) < TOKEN_TTL:
+                return cached.get("token")
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_cached_token(self, token):
+        """Persist the API token with a timestamp, readable only by the user"""
+        try:
+            TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(TOKEN_FILE, "w") as f:
+                json.dump({"token": token, "ts": time.time()}, f)
+            os.chmod(TOKEN_FILE, 0o600)
+        except OSError:
+            pass
+
+    def _clear_cached_token(self):
+        try:
+            os.unlink(TOKEN_FILE)
+        except OSError:
+            pass
+
+    def _api_http(self, method, path, body=None):
+        """Issue an HTTPS request to the API over a persistent connection.
+
+        Replaces the per-request curl subprocess: the TLS handshake is paid
+        once and reused across calls (keep-alive), and responses come back
+        without a fork. Certificate verification is off to match curl -k,
+        since the sandbox API uses self-signed certificates.
+
+        Returns (status, body_text); status is None on connection failure,
+        with the error message as the body.
+        """
+        import http.client
+        import ssl
 
-    def api_login(self, email, password):
-        """Login to API"""
         host = self.config.get("api_host")
-        port = self.config.get("api_port")
+        port = int(self.config.get("api_port"))
 
+        headers = {"Content-Type": "application/json"}
+        if self.api_token:
+            headers["Authorization"] = f"Bearer {self.api_token}"
+
+        error = ""
+        for attempt in range(2):
+            conn = self._api_conn
+            if conn is None or self._api_conn_addr != (host, port):
+                if conn is not None:
+                    conn.close()
+                conn = http.client.HTTPSConnection(
+                    host, port, timeout=15,
+                    context=ssl._create_unverified_context(),
+                )
+                self._api_conn = conn
+                self._api_conn_addr = (host, port)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                return resp.status, resp.read().decode()
+            except (OSError, http.client.HTTPException) as e:
+                # Stale keep-alive or connection refused - drop and retry once
+                error = str(e)
+                conn.close()
+                self._api_conn = None
+
+        return None, error
+
+    def api_login(self, email, password):
+        """Login to API"""
         data = json.dumps({"username": email, "password": password})
-        result = run_cmd(
-            f'curl -sk -X POST "https://{host}:{port}/auth/login" '
-            f'-H "Content-Type: application/json" '
-            f"-d '{data}'"
-        )
+        _, result = self._api_http("POST", "/auth/login", body=data)
 
         try:
-            resp = json.loads(result)
+            resp = _json_loads(result)
             if "token" in resp:
                 self.api_token = resp["token"]
+                self._save_cached_token(self.api_token)
                 print(green("✓ Login successful"))
             else:
                 print(red(f"✗ Login failed: {resp.get('message', result)}"))
-        except json.JSONDecodeError:
+        except ValueError:
             print(red(f"✗ Login failed: {result}"))
 
     def api_request(self, method, path, data=None):
@@ -2469,25 +2987,15 @@ Type 'help <command>' for detailed usage.
             print(yellow("Not logged in. Use 'login <email>' first."))
             return
 
-        host = self.config.get("api_host")
-        port = self.config.get("api_port")
-
         if not path.startswith("/"):
             path = "/" + path
 
-        cmd = f'curl -sk -X {method} "https://{host}:{port}{path}" '
-        cmd += f'-H "Authorization: Bearer {self.api_token}" '
-        cmd += '-H "Content-Type: application/json" '
-
-        if data:
-            cmd += f"-d '{data}'"
-
-        result = run_cmd(cmd)
+        _, result = self._api_http(method, path, body=data)
 
         try:
-            parsed = json.loads(result)
-            print(json.dumps(parsed, indent=2))
-        except json.JSONDecodeError:
+            parsed = _json_loads(result)
+            print(_json_dumps_pretty(parsed))
+        except ValueError:
             print(result)
 
     def cmd_ext(self, args):
@@ -2530,16 +3038,10 @@ Type 'help <command>' for detailed usage.
         if not self.ensure_login():
             return
 
-        host = self.config.get("api_host")
-        port = self.config.get("api_port")
-
-        result = run_cmd(
-            f'curl -sk "https://{host}:{port}/v1.0/extensions" '
-            f'-H "Authorization: Bearer {self.api_token}"'
-        )
+        _, result = self._api_http("GET", "/v1.0/extensions")
 
         try:
-            data = json.loads(result)
+            data = _json_loads(result)
             if isinstance(data, list):
                 print(f"\n{'Extension':<12} {'Name':<20} {'ID'}")
                 print("-" * 60)
@@ -2547,8 +3049,8 @@ Type 'help <command>' for detailed usage.
                     print(f"{ext.get('extension', 'N/A'):<12} {ext.get('name', ''):<20} {gray(ext.get('id', ''))}")
                 print()
             else:
-                print(json.dumps(data, indent=2))
-        except json.JSONDecodeError:
+                print(_json_dumps_pretty(data))
+        except ValueError:
             print(result)
 
     def ext_create(self, extension, password, name):
@@ -2556,25 +3058,17 @@ Type 'help <command>' for detailed usage.
         if not self.ensure_login():
             return
 
-        host = self.config.get("api_host")
-        port = self.config.get("api_port")
-
         data = json.dumps({"extension": extension, "password": password, "name": name})
-        result = run_cmd(
-            f'curl -sk -X POST "https://{host}:{port}/v1.0/extensions" '
-            f'-H "Authorization: Bearer {self.api_token}" '
-            f'-H "Content-Type: application/json" '
-            f"-d '{data}'"
-        )
+        _, result = self._api_http("POST", "/v1.0/extensions", body=data)
 
         try:
-            resp = json.loads(result)
+            resp = _json_loads(result)
             if "id" in resp:
                 print(green(f"✓ Created extension {extension}"))
                 print(f"  ID: {gray(resp['id'])}")
             else:
                 print(red(f"✗ Failed: {resp.get('message', result)}"))
-        except json.JSONDecodeError:
+        except ValueError:
             print(result)
 
     def ext_delete(self, ext_id):
@@ -2582,13 +3076,7 @@ Type 'help <command>' for detailed usage.
         if not self.ensure_login():
             return
 
-        host = self.config.get("api_host")
-        port = self.config.get("api_port")
-
-        result = run_cmd(
-            f'curl -sk -X DELETE "https://{host}:{port}/v1.0/extensions/{ext_id}" '
-            f'-H "Authorization: Bearer {self.api_token}"'
-        )
+        _, result = self._api_http("DELETE", f"/v1.0/extensions/{ext_id}")
 
         if not result or result == "{}":
             print(green(f"✓ Deleted extension {ext_id}"))
@@ -2608,7 +3096,7 @@ Type 'help <command>' for detailed usage.
         subcmd = args[0].lower()
 
         if subcmd not in ("account", "billing"):
-            print(f"{red('✗')} Unknown subcommand: {subcmd}")
+            print(f"{RED_CROSS} Unknown subcommand: {subcmd}")
             print("  Available: account, billing")
             print("  Type 'billing help' for usage.")
             return
@@ -2701,68 +3189,104 @@ Type 'billing <subcommand> help' for more details.
 
         key = (subcmd, action)
         if key not in help_info:
-            print(f"{red('✗')} Unknown command: billing {subcmd} {action}")
+            print(f"{RED_CROSS} Unknown command: billing {subcmd} {action}")
             return
 
         desc, required, optional = help_info[key]
-        print(f"\n{bold(desc)}\n")
-        print(f"{blue('Usage:')} billing {subcmd} {action} [options]\n")
-
-        if required:
-            print(f"{blue('Required:')}")
-            for arg, desc in required:
-                print(f"  --{arg:<20} {desc}")
-            print()
-
-        if optional:
-            print(f"{blue('Optional:')}")
-            for arg, desc in optional:
-                print(f"  --{arg:<20} {desc}")
-            print()
-
-    def _run_billing_command(self, subcmd, action, args, verbose):
-        """Execute a billing command"""
-        config = SIDECAR_COMMANDS["billing"]
+        print_action_help(desc, f"billing {subcmd} {action} [options]", required, optional)
+
+    # Items from the most recent list are kept briefly so a follow-up delete
+    # can show its confirmation details without a second docker-exec round
+    # trip. Mutations drop the affected entry; the TTL bounds staleness.
+    _LISTED_TTL = 60
+
+    def _remember_listed(self, scope, items):
+        """Cache list results per (service, subcmd) scope."""
+        now = time.time()
+        cache = self._last_listed.setdefault(scope, {})
+        for item in items:
+            item_id = item.get("id")
+            if item_id:
+                cache[item_id] = (item, now)
+
+    def _recall_listed(self, scope, item_id):
+        """Return a recently listed item, or None if missing or expired."""
+        entry = self._last_listed.get(scope, {}).get(item_id)
+        if entry and time.time() - entry[1] < self._LISTED_TTL:
+            return entry[0]
+        return None
+
+    def _forget_listed(self, scope, item_id=None):
+        """Invalidate one cached item, or the whole scope."""
+        if item_id is None:
+            self._last_listed.pop(scope, None)
+        else:
+            self._last_listed.get(scope, {}).pop(item_id, None)
+
+    def _fetch_for_delete(self, scope, container, get_command, item_id):
+        """Get delete-confirmation details, preferring the list cache."""
+        data = self._recall_listed(scope, item_id)
+        if data is not None:
+            return data
+        success, data = run_sidecar_command(container, get_command, {"id": item_id}, verbose=False)
+        return data if success else None
+
+    def _run_sidecar(self, service, subcmd, action, args, verbose,
+                     delete_entity=None, check_action=True):
+        """
+        Shared execution path for the dedicated sidecar runners: validate the
+        action, prompt for missing args, confirm deletes, run the command, and
+        maintain the list cache. Returns (success, data); on False the error
+        has already been printed (or the user aborted).
+        """
+        config = SIDECAR_COMMANDS[service]
         container = config["container"]
         binary = config["binary"]
-        command_key = ("billing", subcmd, action)
+        command_key = (service, subcmd, action)
 
         # Check if action is valid
-        valid_actions = config["subcommands"].get(subcmd, {}).get("commands", [])
-        if action not in valid_actions:
-            print(f"{red('✗')} Unknown command: billing {subcmd} {action}")
-            print(f"  Available: {', '.join(valid_actions)}")
-            return
+        if check_action:
+            valid_actions = _SIDECAR_VALID_ACTIONS.get((service, subcmd), ())
+            if action not in valid_actions:
+                print(f"{RED_CROSS} Unknown command: {service} {subcmd} {action}")
+                print(f"  Available: {', '.join(valid_actions)}")
+                return False, None
 
         # Prompt for missing required args
         args = prompt_missing_args(command_key, args)
         if args is None:
-            return
+            return False, None
 
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS:
-            # First get the resource to show details
-            get_args = {"id": args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} {subcmd} get", get_args, verbose=False)
-            if success and data:
-                if not confirm_delete("billing account", data):
-                    return
+        scope = (service, subcmd)
 
-        # Build and run command
-        cmd_args = {subcmd: None}  # Add subcommand
-        cmd_args[action] = None  # Add action
-        cmd_args.update(args)
+        # Confirm delete. --yes or a non-interactive stdin skips the
+        # confirmation (and its details fetch) so scripted runs don't hang.
+        skip_confirm = bool(args.pop("yes", False))
+        if command_key in _SIDECAR_DELETE_SET and not skip_confirm and sys.stdin.isatty():
+            data = self._fetch_for_delete(scope, container, f"{binary} {subcmd} get", args.get("id"))
+            if data:
+                if not confirm_delete(delete_entity or service, data):
+                    return False, None
 
-        # Remove subcommand and action from args, build proper command
-        actual_args = {k: v for k, v in args.items()}
-        success, data = run_sidecar_command(container, f"{binary} {subcmd} {action}", actual_args, verbose)
+        success, data = run_sidecar_command(container, f"{binary} {subcmd} {action}", args, verbose)
 
         if not success:
-            print(f"{red('✗')} {data}")
-            return
+            print(f"{RED_CROSS} {data}")
+            return False, None
 
-        # Format output
-        self._format_billing_output(subcmd, action, data, command_key)
+        if action == "list" and isinstance(data, list):
+            self._remember_listed(scope, data)
+        elif action != "get":
+            self._forget_listed(scope, args.get("id"))
+
+        return True, data
+
+    def _run_billing_command(self, subcmd, action, args, verbose):
+        """Execute a billing command"""
+        success, data = self._run_sidecar("billing", subcmd, action, args, verbose,
+                                          delete_entity="billing account")
+        if success:
+            self._format_billing_output(subcmd, action, data, ("billing", subcmd, action))
 
     def _format_billing_output(self, subcmd, action, data, command_key):
         """Format and display billing command output"""
@@ -2780,7 +3304,7 @@ Type 'billing <subcommand> help' for more details.
 
         elif action == "get":
             if not data:
-                print(f"{red('✗')} Not found.")
+                print(f"{RED_CROSS} Not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -2791,16 +3315,16 @@ Type 'billing <subcommand> help' for more details.
         elif action == "create":
             if data:
                 item_id = data.get("id", "unknown")
-                print(f"{green('✓')} Created: {item_id}")
+                print(f"{GREEN_CHECK} Created: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} Deleted.")
+            print(f"{GREEN_CHECK} Deleted.")
 
         elif action in ("add-balance", "subtract-balance"):
             if data:
                 new_balance = data.get("balance", "unknown")
                 name = data.get("name", "account")
-                print(f"{green('✓')} Balance updated for \"{name}\"")
+                print(f"{GREEN_CHECK} Balance updated for \"{name}\"")
                 print(f"  New balance: {new_balance}")
 
     def cmd_customer(self, args):
@@ -2833,7 +3357,7 @@ Type 'billing <subcommand> help' for more details.
             action = subcmd
             valid_actions = ["list", "create", "get", "delete", "update", "update-billing-account"]
             if action not in valid_actions:
-                print(f"{red('✗')} Unknown subcommand: {action}")
+                print(f"{RED_CROSS} Unknown subcommand: {action}")
                 print("  Available: customer, accesskey")
                 print("  Type 'customer help' for usage.")
                 return
@@ -2930,62 +3454,19 @@ Type 'customer <subcommand> help' for more details.
 
         key = (subcmd, action)
         if key not in help_info:
-            print(f"{red('✗')} Unknown command: customer {subcmd} {action}")
+            print(f"{RED_CROSS} Unknown command: customer {subcmd} {action}")
             return
 
         desc, required, optional = help_info[key]
-        print(f"\n{bold(desc)}\n")
-        print(f"{blue('Usage:')} customer {subcmd} {action} [options]\n")
-
-        if required:
-            print(f"{blue('Required:')}")
-            for arg, arg_desc in required:
-                print(f"  --{arg:<20} {arg_desc}")
-            print()
-
-        if optional:
-            print(f"{blue('Optional:')}")
-            for arg, arg_desc in optional:
-                print(f"  --{arg:<20} {arg_desc}")
-            print()
+        print_action_help(desc, f"customer {subcmd} {action} [options]", required, optional)
 
     def _run_customer_command(self, subcmd, action, args, verbose):
         """Execute a customer command"""
-        config = SIDECAR_COMMANDS["customer"]
-        container = config["container"]
-        binary = config["binary"]
-        command_key = ("customer", subcmd, action)
-
-        # Check if action is valid
-        valid_actions = config["subcommands"].get(subcmd, {}).get("commands", [])
-        if action not in valid_actions:
-            print(f"{red('✗')} Unknown command: customer {subcmd} {action}")
-            print(f"  Available: {', '.join(valid_actions)}")
-            return
-
-        # Prompt for missing required args
-        args = prompt_missing_args(command_key, args)
-        if args is None:
-            return
-
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS:
-            # First get the resource to show details
-            get_args = {"id": args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} {subcmd} get", get_args, verbose=False)
-            if success and data:
-                entity = "customer" if subcmd == "customer" else "accesskey"
-                if not confirm_delete(entity, data):
-                    return
-
-        success, data = run_sidecar_command(container, f"{binary} {subcmd} {action}", args, verbose)
-
-        if not success:
-            print(f"{red('✗')} {data}")
-            return
-
-        # Format output
-        self._format_customer_output(subcmd, action, data, command_key)
+        entity = "customer" if subcmd == "customer" else "accesskey"
+        success, data = self._run_sidecar("customer", subcmd, action, args, verbose,
+                                          delete_entity=entity)
+        if success:
+            self._format_customer_output(subcmd, action, data, ("customer", subcmd, action))
 
     def _format_customer_output(self, subcmd, action, data, command_key):
         """Format and display customer command output"""
@@ -3004,7 +3485,7 @@ Type 'customer <subcommand> help' for more details.
 
         elif action == "get":
             if not data:
-                print(f"{red('✗')} {entity_singular} not found.")
+                print(f"{RED_CROSS} {entity_singular} not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -3016,17 +3497,17 @@ Type 'customer <subcommand> help' for more details.
                 item_id = data.get("id", "unknown")
                 if subcmd == "customer":
                     email = data.get("email", "")
-                    print(f"{green('✓')} {entity_singular} created: {email}")
+                    print(f"{GREEN_CHECK} {entity_singular} created: {email}")
                 else:
                     name = data.get("name", "")
-                    print(f"{green('✓')} {entity_singular} created: {name}")
+                    print(f"{GREEN_CHECK} {entity_singular} created: {name}")
                 print(f"  ID: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} {entity_singular} deleted.")
+            print(f"{GREEN_CHECK} {entity_singular} deleted.")
 
         elif action.startswith("update"):
-            print(f"{green('✓')} {entity_singular} updated.")
+            print(f"{GREEN_CHECK} {entity_singular} updated.")
 
     def cmd_number(self, args):
         """Phone number management"""
@@ -3038,7 +3519,7 @@ Type 'customer <subcommand> help' for more details.
 
         valid_actions = ["list", "create", "get", "delete", "register", "update", "get-available"]
         if action not in valid_actions:
-            print(f"{red('✗')} Unknown subcommand: {action}")
+            print(f"{RED_CROSS} Unknown subcommand: {action}")
             print(f"  Available: {', '.join(valid_actions)}")
             print("  Type 'number help' for usage.")
             return
@@ -3093,50 +3574,14 @@ Type 'customer <subcommand> help' for more details.
             return
 
         desc, required, optional = help_info[action]
-        print(f"\n{bold(desc)}\n")
-        print(f"{blue('Usage:')} number {action} [options]\n")
-
-        if required:
-            print(f"{blue('Required:')}")
-            for arg, desc in required:
-                print(f"  --{arg:<20} {desc}")
-            print()
-
-        if optional:
-            print(f"{blue('Optional:')}")
-            for arg, desc in optional:
-                print(f"  --{arg:<20} {desc}")
-            print()
+        print_action_help(desc, f"number {action} [options]", required, optional)
 
     def _run_number_command(self, action, args, verbose):
         """Execute a number command"""
-        config = SIDECAR_COMMANDS["number"]
-        container = config["container"]
-        binary = config["binary"]
-        command_key = ("number", "number", action)
-
-        # Prompt for missing required args
-        args = prompt_missing_args(command_key, args)
-        if args is None:
-            return
-
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS:
-            # First get the resource to show details
-            get_args = {"id": args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} number get", get_args, verbose=False)
-            if success and data:
-                if not confirm_delete("number", data):
-                    return
-
-        success, data = run_sidecar_command(container, f"{binary} number {action}", args, verbose)
-
-        if not success:
-            print(f"{red('✗')} {data}")
-            return
-
-        # Format output
-        self._format_number_output(action, data, command_key)
+        success, data = self._run_sidecar("number", "number", action, args, verbose,
+                                          delete_entity="number", check_action=False)
+        if success:
+            self._format_number_output(action, data, ("number", "number", action))
 
     def _format_number_output(self, action, data, command_key):
         """Format and display number command output"""
@@ -3152,7 +3597,7 @@ Type 'customer <subcommand> help' for more details.
 
         elif action == "get":
             if not data:
-                print(f"{red('✗')} Number not found.")
+                print(f"{RED_CROSS} Number not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -3163,14 +3608,14 @@ Type 'customer <subcommand> help' for more details.
             if data:
                 number = data.get("number", "unknown")
                 item_id = data.get("id", "unknown")
-                print(f"{green('✓')} Number {'registered' if action == 'register' else 'created'}: {number}")
+                print(f"{GREEN_CHECK} Number {'registered' if action == 'register' else 'created'}: {number}")
                 print(f"  ID: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} Number deleted.")
+            print(f"{GREEN_CHECK} Number deleted.")
 
         elif action == "update":
-            print(f"{green('✓')} Number updated.")
+            print(f"{GREEN_CHECK} Number updated.")
 
         elif action == "get-available":
             if not data:
@@ -3190,7 +3635,7 @@ Type 'customer <subcommand> help' for more details.
         subcmd = args[0].lower()
 
         if subcmd not in ("extension", "trunk"):
-            print(f"{red('✗')} Unknown subcommand: {subcmd}")
+            print(f"{RED_CROSS} Unknown subcommand: {subcmd}")
             print("  Available: extension, trunk")
             print("  Type 'registrar help' for usage.")
             return
@@ -3281,64 +3726,20 @@ Type 'registrar <subcommand> help' for more details.
 
         key = (subcmd, action)
         if key not in help_info:
-            print(f"{red('✗')} Unknown command: registrar {subcmd} {action}")
+            print(f"{RED_CROSS} Unknown command: registrar {subcmd} {action}")
             return
 
         desc, required, optional = help_info[key]
-        print(f"\n{bold(desc)}\n")
-        print(f"{blue('Usage:')} registrar {subcmd} {action} [options]\n")
-
-        if required:
-            print(f"{blue('Required:')}")
-            for arg, desc in required:
-                print(f"  --{arg:<20} {desc}")
-            print()
-
-        if optional:
-            print(f"{blue('Optional:')}")
-            for arg, desc in optional:
-                print(f"  --{arg:<20} {desc}")
-            print()
+        print_action_help(desc, f"registrar {subcmd} {action} [options]", required, optional)
 
     def _run_registrar_command(self, subcmd, action, args, verbose):
         """Execute a registrar command"""
-        config = SIDECAR_COMMANDS["registrar"]
-        container = config["container"]
-        binary = config["binary"]
-        command_key = ("registrar", subcmd, action)
-
-        # Check if action is valid
-        valid_actions = config["subcommands"].get(subcmd, {}).get("commands", [])
-        if action not in valid_actions:
-            print(f"{red('✗')} Unknown command: registrar {subcmd} {action}")
-            print(f"  Available: {', '.join(valid_actions)}")
-            return
-
-        # Prompt for missing required args
-        args = prompt_missing_args(command_key, args)
-        if args is None:
-            return
-
         # Note: registrar-control outputs JSON by default, no --format flag needed
-
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS:
-            # First get the resource to show details
-            get_args = {"id": args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} {subcmd} get", get_args, verbose=False)
-            if success and data:
-                resource_type = "extension" if subcmd == "extension" else "trunk"
-                if not confirm_delete(resource_type, data):
-                    return
-
-        success, data = run_sidecar_command(container, f"{binary} {subcmd} {action}", args, verbose)
-
-        if not success:
-            print(f"{red('✗')} {data}")
-            return
-
-        # Format output
-        self._format_registrar_output(subcmd, action, data, command_key)
+        resource_type = "extension" if subcmd == "extension" else "trunk"
+        success, data = self._run_sidecar("registrar", subcmd, action, args, verbose,
+                                          delete_entity=resource_type)
+        if success:
+            self._format_registrar_output(subcmd, action, data, ("registrar", subcmd, action))
 
     def _format_registrar_output(self, subcmd, action, data, command_key):
         """Format and display registrar command output"""
@@ -3357,7 +3758,7 @@ Type 'registrar <subcommand> help' for more details.
 
         elif action == "get":
             if not data:
-                print(f"{red('✗')} {entity_singular} not found.")
+                print(f"{RED_CROSS} {entity_singular} not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -3369,17 +3770,17 @@ Type 'registrar <subcommand> help' for more details.
                 item_id = data.get("id", "unknown")
                 if subcmd == "extension":
                     ext_num = data.get("extension_number", "")
-                    print(f"{green('✓')} Extension created: {ext_num}")
+                    print(f"{GREEN_CHECK} Extension created: {ext_num}")
                 else:
                     name = data.get("name", "")
-                    print(f"{green('✓')} Trunk created: {name}")
+                    print(f"{GREEN_CHECK} Trunk created: {name}")
                 print(f"  ID: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} {entity_singular} deleted.")
+            print(f"{GREEN_CHECK} {entity_singular} deleted.")
 
         elif action == "update":
-            print(f"{green('✓')} {entity_singular} updated.")
+            print(f"{GREEN_CHECK} {entity_singular} updated.")
 
     def cmd_agent(self, args):
         """Agent management"""
@@ -3391,7 +3792,7 @@ Type 'registrar <subcommand> help' for more details.
 
         valid_actions = ["list", "create", "get", "delete", "login", "update-addresses", "update-basic-info", "update-password", "update-permission", "update-status", "update-tag-ids"]
         if action not in valid_actions:
-            print(f"{red('✗')} Unknown subcommand: {action}")
+            print(f"{RED_CROSS} Unknown subcommand: {action}")
             print(f"  Available: {', '.join(valid_actions)}")
             print("  Type 'agent help' for usage.")
             return
@@ -3453,50 +3854,14 @@ Type 'registrar <subcommand> help' for more details.
             return
 
         desc, required, optional = help_info[action]
-        print(f"\n{bold(desc)}\n")
-        print(f"{blue('Usage:')} agent {action} [options]\n")
-
-        if required:
-            print(f"{blue('Required:')}")
-            for arg, desc in required:
-                print(f"  --{arg:<20} {desc}")
-            print()
-
-        if optional:
-            print(f"{blue('Optional:')}")
-            for arg, desc in optional:
-                print(f"  --{arg:<20} {desc}")
-            print()
+        print_action_help(desc, f"agent {action} [options]", required, optional)
 
     def _run_agent_command(self, action, args, verbose):
         """Execute an agent command"""
-        config = SIDECAR_COMMANDS["agent"]
-        container = config["container"]
-        binary = config["binary"]
-        command_key = ("agent", "agent", action)
-
-        # Prompt for missing required args
-        args = prompt_missing_args(command_key, args)
-        if args is None:
-            return
-
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS:
-            # First get the resource to show details
-            get_args = {"id": args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} agent get", get_args, verbose=False)
-            if success and data:
-                if not confirm_delete("agent", data):
-                    return
-
-        success, data = run_sidecar_command(container, f"{binary} agent {action}", args, verbose)
-
-        if not success:
-            print(f"{red('✗')} {data}")
-            return
-
-        # Format output
-        self._format_agent_output(action, data, command_key)
+        success, data = self._run_sidecar("agent", "agent", action, args, verbose,
+                                          delete_entity="agent", check_action=False)
+        if success:
+            self._format_agent_output(action, data, ("agent", "agent", action))
 
     def _format_agent_output(self, action, data, command_key):
         """Format and display agent command output"""
@@ -3512,7 +3877,7 @@ Type 'registrar <subcommand> help' for more details.
 
         elif action == "get":
             if not data:
-                print(f"{red('✗')} Agent not found.")
+                print(f"{RED_CROSS} Agent not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -3523,20 +3888,20 @@ Type 'registrar <subcommand> help' for more details.
             if data:
                 username = data.get("username", "unknown")
                 item_id = data.get("id", "unknown")
-                print(f"{green('✓')} Agent created: {username}")
+                print(f"{GREEN_CHECK} Agent created: {username}")
                 print(f"  ID: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} Agent deleted.")
+            print(f"{GREEN_CHECK} Agent deleted.")
 
         elif action == "login":
             if data:
-                print(f"{green('✓')} Login successful.")
+                print(f"{GREEN_CHECK} Login successful.")
                 if "token" in data:
                     print(f"  Token: {data.get('token', '')[:50]}...")
 
         elif action.startswith("update-"):
-            print(f"{green('✓')} Agent updated.")
+            print(f"{GREEN_CHECK} Agent updated.")
 
     # -------------------------------------------------------------------------
     # Generic Sidecar Command Handler
@@ -3553,7 +3918,7 @@ Type 'registrar <subcommand> help' for more details.
 
         config = SIDECAR_COMMANDS.get(service_name)
         if not config:
-            print(f"{red('✗')} Unknown service: {service_name}")
+            print(f"{RED_CROSS} Unknown service: {service_name}")
             return
 
         subcommands = config.get("subcommands", {})
@@ -3588,14 +3953,14 @@ Type 'registrar <subcommand> help' for more details.
                 action = first_arg
                 remaining_args = args[1:]
             else:
-                print(f"{red('✗')} Unknown subcommand: {first_arg}")
+                print(f"{RED_CROSS} Unknown subcommand: {first_arg}")
                 print(f"  Available: {', '.join(subcommands.keys())}")
                 return
 
         # Check if action is valid
-        valid_actions = subcommands.get(subcmd, {}).get("commands", [])
+        valid_actions = _SIDECAR_VALID_ACTIONS.get((service_name, subcmd), ())
         if action not in valid_actions:
-            print(f"{red('✗')} Unknown action: {action}")
+            print(f"{RED_CROSS} Unknown action: {action}")
             print(f"  Available: {', '.join(valid_actions)}")
             return
 
@@ -3609,11 +3974,14 @@ Type 'registrar <subcommand> help' for more details.
         if cmd_args is None:
             return
 
-        # Confirm delete
-        if command_key in SIDECAR_DELETE_COMMANDS and "id" in cmd_args:
-            get_args = {"id": cmd_args.get("id")}
-            success, data = run_sidecar_command(container, f"{binary} {subcmd} get", get_args, verbose=False)
-            if success and data:
+        scope = (service_name, subcmd)
+
+        # Confirm delete (--yes / non-interactive stdin skips it)
+        skip_confirm = bool(cmd_args.pop("yes", False))
+        if (command_key in _SIDECAR_DELETE_SET and "id" in cmd_args
+                and not skip_confirm and sys.stdin.isatty()):
+            data = self._fetch_for_delete(scope, container, f"{binary} {subcmd} get", cmd_args.get("id"))
+            if data:
                 if not confirm_delete(entity_name.lower(), data):
                     return
 
@@ -3621,9 +3989,14 @@ Type 'registrar <subcommand> help' for more details.
         success, data = run_sidecar_command(container, f"{binary} {subcmd} {action}", cmd_args, verbose)
 
         if not success:
-            print(f"{red('✗')} {data}")
+            print(f"{RED_CROSS} {data}")
             return
 
+        if action == "list" and isinstance(data, list):
+            self._remember_listed(scope, data)
+        elif action != "get":
+            self._forget_listed(scope, cmd_args.get("id"))
+
         # Format output
         self._format_generic_output(service_name, subcmd, action, data, command_key, entity_name)
 
@@ -3637,7 +4010,7 @@ Type 'registrar <subcommand> help' for more details.
             subcmd_info = subcommands[subcmd]
             print(f"{blue('Available Commands:')}")
             for cmd in subcmd_info.get("commands", []):
-                print(f"  {cmd:<25} {cmd.replace('-', ' ').title()}")
+                print(f"  {cmd:<25} {action_label(cmd)}")
             print(f"\n{blue('Usage:')} {service_name} <command> [options]")
         else:
             # Multiple subcommands
@@ -3653,7 +4026,7 @@ Type 'registrar <subcommand> help' for more details.
         print(f"\n{bold(subcmd_info.get('description', subcmd.title()))}\n")
         print(f"{blue('Available Commands:')}")
         for cmd in subcmd_info.get("commands", []):
-            print(f"  {cmd:<25} {cmd.replace('-', ' ').title()}")
+            print(f"  {cmd:<25} {action_label(cmd)}")
         print(f"\n{blue('Usage:')} {service_name} {subcmd} <command> [options]\n")
 
     def _format_generic_output(self, service_name, subcmd, action, data, command_key, entity_name):
@@ -3673,7 +4046,7 @@ Type 'registrar <subcommand> help' for more details.
 
         elif action == "get" or action.startswith("get-"):
             if not data:
-                print(f"{red('✗')} {entity_name} not found.")
+                print(f"{RED_CROSS} {entity_name} not found.")
                 return
             fields = SIDECAR_DETAIL_FIELDS.get(command_key)
             if fields:
@@ -3688,33 +4061,33 @@ Type 'registrar <subcommand> help' for more details.
                 item_id = data.get("id", "unknown")
                 name = data.get("name", data.get("username", ""))
                 if name:
-                    print(f"{green('✓')} {entity_name} created: {name}")
+                    print(f"{GREEN_CHECK} {entity_name} created: {name}")
                 else:
-                    print(f"{green('✓')} {entity_name} created")
+                    print(f"{GREEN_CHECK} {entity_name} created")
                 print(f"  ID: {item_id}")
 
         elif action == "delete":
-            print(f"{green('✓')} {entity_name} deleted.")
+            print(f"{GREEN_CHECK} {entity_name} deleted.")
 
         elif action.startswith("update") or action.startswith("add") or action.startswith("remove"):
-            print(f"{green('✓')} {entity_name} updated.")
+            print(f"{GREEN_CHECK} {entity_name} updated.")
 
         elif action == "hangup":
-            print(f"{green('✓')} Call hung up.")
+            print(f"{GREEN_CHECK} Call hung up.")
 
         elif action == "terminating":
-            print(f"{green('✓')} Conference terminated.")
+            print(f"{GREEN_CHECK} Conference terminated.")
 
         elif action.startswith("recording-") or action.startswith("transcribe-"):
             op = "started" if action.endswith("-start") else "stopped"
             what = "Recording" if "recording" in action else "Transcription"
-            print(f"{green('✓')} {what} {op}.")
+            print(f"{GREEN_CHECK} {what} {op}.")
 
         elif action.startswith("send-"):
-            print(f"{green('✓')} Webhook sent.")
+            print(f"{GREEN_CHECK} Webhook sent.")
 
         elif action == "service-start":
-            print(f"{green('✓')} Transfer service started.")
+            print(f"{GREEN_CHECK} Transfer service started.")
 
         else:
             # Generic success
@@ -3724,9 +4097,9 @@ Type 'registrar <subcommand> help' for more details.
                 elif isinstance(data, list) and data:
                     print(json.dumps(data, indent=2))
                 else:
-                    print(f"{green('✓')} Operation completed.")
+                    print(f"{GREEN_CHECK} Operation completed.")
             else:
-                print(f"{green('✓')} Operation completed.")
+                print(f"{GREEN_CHECK} Operation completed.")
 
     # -------------------------------------------------------------------------
     # New Sidecar Command Handlers
@@ -3818,69 +4191,187 @@ Type 'registrar <subcommand> help' for more details.
         else:
             print(f"{key}: {self.config.get(key)}")
 
+    _DNS_SUBCOMMANDS = {
+        "status": "dns_status",
+        "list": "dns_list",
+        "setup": "dns_setup",
+        "regenerate": "dns_regenerate",
+        "test": "dns_test",
+    }
+
     def cmd_dns(self, args):
         """DNS setup for SIP domains"""
         subcmd = args[0].lower() if args else "status"
+        # Debug escape hatch: run lookups one at a time so a misbehaving
+        # resolver can be observed without the parallel fan-out interleaving.
+        self._dns_sequential = "--sequential" in args[1:]
 
-        if subcmd == "status":
-            self.dns_status()
-        elif subcmd == "list":
-            self.dns_list()
-        elif subcmd == "setup":
-            self.dns_setup()
-        elif subcmd == "regenerate":
-            self.dns_regenerate()
-        elif subcmd == "test":
-            self.dns_test()
+        method_name = self._DNS_SUBCOMMANDS.get(subcmd)
+        if method_name:
+            getattr(self, method_name)()
         else:
             print("Usage: dns [status|list|setup|regenerate|test]")
 
+    def _get_dns_resolver(self):
+        """Build the dnspython resolver once per session; None if unavailable."""
+        if self._dns_resolver is False:
+            try:
+                import dns.resolver
+            except ImportError:
+                self._dns_resolver = None
+            else:
+                resolver = dns.resolver.Resolver(configure=False)
+                resolver.nameservers = ["127.0.0.1"]
+                resolver.lifetime = 2
+                self._dns_resolver = resolver
+        return self._dns_resolver
+
+    def _resolve_domain(self, domain):
+        """Resolve a domain, trying CoreDNS first, then the system resolver.
+
+        Uses dnspython in-process when it is installed (no dig fork per
+        lookup); otherwise falls back to the dig/getent chain.
+        """
+        resolver = self._get_dns_resolver()
+        if resolver is not None:
+            try:
+                answer = resolver.resolve(domain, "A")
+                return str(answer[0])
+            except Exception:
+                pass  # CoreDNS miss or not running; try the system resolver
+
+        # dig/getent run without a shell; the head -1 / awk '{print $1}'
+        # trimming the old pipelines did happens in Python instead.
+        result = run_argv(["dig", "+short", domain, "@127.0.0.1"], merge_stderr=False)
+        if not result:
+            result = run_argv(["dig", "+short", domain], merge_stderr=False)
+        if not result:
+            getent = run_argv(["getent", "hosts", domain], merge_stderr=False)
+            return getent.split()[0] if getent else ""
+        return result.split("\n", 1)[0]
+
+    # CoreDNS state only changes when the setup scripts run, so cache the
+    # container check a bit longer than the general docker ps cache. The
+    # dns setup/regenerate paths invalidate it explicitly.
+    _COREDNS_CHECK_TTL = 5
+
+    def _coredns_running(self):
+        """Check whether the CoreDNS container is up (cached ~5s)."""
+        now = time.time()
+        if self._coredns_check and now - self._coredns_check[1] < self._COREDNS_CHECK_TTL:
+            return self._coredns_check[0]
+        running = "voipbin-dns" in get_running_container_names()
+        self._coredns_check = (running, now)
+        return running
+
+    _DNS_RESOLVE_WORKERS = 8
+
+    def _resolve_batch_async(self, domains):
+        """Resolve a batch on one event loop with dns.asyncresolver.
+
+        A single loop issues all queries concurrently with no thread
+        overhead. Returns None if the async path is unusable so the caller
+        can fall back; individual failures are retried through the normal
+        per-domain fallback chain.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        import asyncio
+
+        try:
+            import dns.asyncresolver
+        except ImportError:
+            return None
+
+        async def gather():
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = ["127.0.0.1"]
+            resolver.lifetime = 2
+            return await asyncio.gather(
+                *(resolver.resolve(d, "A") for d in domains),
+                return_exceptions=True,
+            )
+
+        try:
+            answers = asyncio.run(gather())
+        except Exception:
+            return None
+
+        results = [None] * len(domains)
+        failed = []
+        for i, answer in enumerate(answers):
+            if isinstance(answer, BaseException):
+                failed.append(i)
+            else:
+                results[i] = str(answer[0])
+
+        if failed:
+            workers = min(len(failed), self._DNS_RESOLVE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for i, result in zip(failed, executor.map(
+                        self._resolve_domain, [domains[i] for i in failed])):
+                    results[i] = result
+        return results
+
+    def _resolve_many(self, domains):
+        """Resolve a batch of domains in input order, in parallel by default."""
+        from concurrent.futures import ThreadPoolExecutor
+        if self._dns_sequential:
+            return [self._resolve_domain(d) for d in domains]
+        if self._get_dns_resolver() is not None:
+            results = self._resolve_batch_async(domains)
+            if results is not None:
+                return results
+        workers = min(len(domains), self._DNS_RESOLVE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._resolve_domain, domains))
+
     def dns_status(self):
         """Check DNS configuration status"""
-        host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "127.0.0.1"
-        kamailio_ip = run_cmd("grep '^KAMAILIO_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or host_ip
-        rtpengine_ip = run_cmd("grep '^RTPENGINE_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or kamailio_ip
+        env = self._load_env()
+        host_ip = env.get("HOST_EXTERNAL_IP") or "127.0.0.1"
+        kamailio_ip = env.get("KAMAILIO_EXTERNAL_IP") or host_ip
+        rtpengine_ip = env.get("RTPENGINE_EXTERNAL_IP") or kamailio_ip
 
-        print(f"\n{bold('DNS Configuration Status')}")
-        print("-" * 50)
+        # Accumulate the report and emit it with one write at the end, like
+        # the table/detail formatters.
+        lines = [f"\n{bold('DNS Configuration Status')}", "-" * 50]
 
         # Check if CoreDNS container is running
-        coredns_running = "voipbin-dns" in run_cmd("docker ps --format '{{.Names}}' 2>/dev/null")
+        coredns_running = self._coredns_running()
         if coredns_running:
-            print(f"  {green('●')} CoreDNS container: running (port 53)")
+            lines.append(f"  {GREEN_CIRCLE} CoreDNS container: running (port 53)")
         else:
-            print(f"  {red('○')} CoreDNS container: not running")
+            lines.append(f"  {RED_CIRCLE} CoreDNS container: not running")
 
         # Check OS-specific configuration
-        import platform
         if platform.system() == "Darwin":
             # macOS
-            config_exists = os.path.exists("/etc/resolver/voipbin.test")
+            config_exists = path_exists_cached("/etc/resolver/voipbin.test")
             if config_exists:
-                print(f"  {green('●')} macOS resolver: configured (/etc/resolver/voipbin.test)")
+                lines.append(f"  {GREEN_CIRCLE} macOS resolver: configured (/etc/resolver/voipbin.test)")
             else:
-                print(f"  {gray('○')} macOS resolver: not configured")
+                lines.append(f"  {GRAY_CIRCLE} macOS resolver: not configured")
         else:
             # Linux - check resolv.conf points to 127.0.0.1
             resolv_conf = run_cmd("cat /etc/resolv.conf 2>/dev/null") or ""
             config_exists = "nameserver 127.0.0.1" in resolv_conf
             if config_exists:
-                print(f"  {green('●')} resolv.conf: configured (nameserver 127.0.0.1)")
+                lines.append(f"  {GREEN_CIRCLE} resolv.conf: configured (nameserver 127.0.0.1)")
             else:
-                print(f"  {gray('○')} resolv.conf: not configured")
+                lines.append(f"  {GRAY_CIRCLE} resolv.conf: not configured")
 
         # Show IP configuration
-        print(f"\n{bold('IP Configuration')}")
-        print("-" * 50)
-        print(f"  Host IP:      {host_ip} (web services)")
-        print(f"  Kamailio IP:  {kamailio_ip} (SIP signaling)")
-        print(f"  RTPEngine IP: {rtpengine_ip} (RTP media)")
+        lines.append(f"\n{bold('IP Configuration')}")
+        lines.append("-" * 50)
+        lines.append(f"  Host IP:      {host_ip} (web services)")
+        lines.append(f"  Kamailio IP:  {kamailio_ip} (SIP signaling)")
+        lines.append(f"  RTPEngine IP: {rtpengine_ip} (RTP media)")
         if kamailio_ip == host_ip:
-            print(f"  {yellow('!')} Warning: Kamailio uses same IP as host (SIP loop issues possible)")
+            lines.append(f"  {YELLOW_BANG} Warning: Kamailio uses same IP as host (SIP loop issues possible)")
 
         # Test resolution
-        print(f"\n{bold('Resolution Test')}")
-        print("-" * 50)
+        lines.append(f"\n{bold('Resolution Test')}")
+        lines.append("-" * 50)
 
         # Web services resolve to HOST_IP (Docker port mapping)
         # SIP services resolve to KAMAILIO_IP
@@ -3894,114 +4385,119 @@ Type 'registrar <subcommand> help' for more details.
             ("test.registrar.voipbin.test", kamailio_ip, "SIP (Kamailio)"),
         ]
 
-        for domain, expected, desc in test_domains:
-            # Try CoreDNS directly first (port 53)
-            result = run_cmd(f"dig +short {domain} @127.0.0.1 2>/dev/null | head -1")
-            if not result:
-                # Fallback to system resolver
-                result = run_cmd(f"dig +short {domain} 2>/dev/null | head -1") or run_cmd(f"getent hosts {domain} 2>/dev/null | awk '{{print $1}}'")
+        # Each lookup can take up to a dig timeout when resolution fails, so
+        # run the sweep in parallel and print results in the original order.
+        results = self._resolve_many([d for d, _, _ in test_domains])
+
+        for (domain, expected, desc), result in zip(test_domains, results):
             if result == expected:
-                print(f"  {green('✓')} {domain} → {result} {gray('(' + desc + ')')}")
+                lines.append(f"  {GREEN_CHECK} {domain} → {result} {gray('(' + desc + ')')}")
             elif result:
-                print(f"  {yellow('!')} {domain} → {result} (expected: {expected})")
+                lines.append(f"  {YELLOW_BANG} {domain} → {result} (expected: {expected})")
             else:
-                print(f"  {red('✗')} {domain} → (no resolution)")
+                lines.append(f"  {RED_CROSS} {domain} → (no resolution)")
 
         if not coredns_running:
-            print(f"\n{yellow('Hint')}: Start CoreDNS with 'docker compose up -d coredns'")
+            lines.append(f"\n{yellow('Hint')}: Start CoreDNS with 'docker compose up -d coredns'")
         elif not config_exists:
-            print(f"\n{yellow('Hint')}: Run 'dns setup' to configure DNS forwarding")
-        print()
+            lines.append(f"\n{yellow('Hint')}: Run 'dns setup' to configure DNS forwarding")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def dns_list(self):
         """List all DNS domains and their purposes"""
-        host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "localhost"
-        kamailio_ip = run_cmd("grep '^KAMAILIO_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or host_ip
-        rtpengine_ip = run_cmd("grep '^RTPENGINE_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or kamailio_ip
-
-        print(f"""
-{bold('VoIPBin DNS Domains')}
-{'=' * 70}
-
-{bold('IP Configuration')}
-  Host IP:      {host_ip} (web services)
-  Kamailio IP:  {kamailio_ip} (SIP signaling)
-  RTPEngine IP: {rtpengine_ip} (RTP media)
-
-{bold('Web Services')} (resolve to Host IP, Docker port mapping)
-{'-' * 70}
-  {'Domain':<35} {'Resolves To':<18} {'Port'}
-  {'api.voipbin.test':<35} {host_ip:<18} :8443
-  {'admin.voipbin.test':<35} {host_ip:<18} :3003
-  {'meet.voipbin.test':<35} {host_ip:<18} :3004
-  {'talk.voipbin.test':<35} {host_ip:<18} :3005
-
-{bold('SIP/VoIP Services')} (resolve to Kamailio IP: {kamailio_ip})
-{'-' * 70}
-  {'Domain':<35} {'Port':<8} {'Description'}
-  {'sip.voipbin.test':<35} {'5060':<8} SIP proxy (UDP/TCP)
-  {'sip-service.voipbin.test':<35} {'5060':<8} SIP proxy (alias)
-  {'pstn.voipbin.test':<35} {'5060':<8} PSTN gateway
-  {'trunk.voipbin.test':<35} {'5060':<8} SIP trunking
-  {'*.registrar.voipbin.test':<35} {'5060':<8} SIP registration
-                                             (e.g., {{customer_id}}.registrar.voipbin.test)
-
-{bold('Internal Services')} (Docker bridge network)
-{'-' * 70}
-  {'Service':<35} {'IP':<16} {'Description'}
-  {'api-manager':<35} {'172.28.0.100':<16} API Manager container
-  {'square-admin':<35} {'172.28.0.101':<16} Admin Console container
-  {'square-meet':<35} {'172.28.0.102':<16} Meet container
-  {'square-talk':<35} {'172.28.0.103':<16} Talk container
+        env = self._load_env()
+        host_ip = env.get("HOST_EXTERNAL_IP") or "localhost"
+        kamailio_ip = env.get("KAMAILIO_EXTERNAL_IP") or host_ip
+        rtpengine_ip = env.get("RTPENGINE_EXTERNAL_IP") or kamailio_ip
 
-{bold('Example SIP URIs')}
-{'-' * 70}
-  Extension registration:  sip:1000@{{customer_id}}.registrar.voipbin.test
-  Extension call:          sip:2000@{{customer_id}}.registrar.voipbin.test
-  PSTN call:               sip:+15551234567@pstn.voipbin.test
-
-{bold('DNS Commands')}
-{'-' * 70}
-  dns status    Check DNS configuration status
-  dns list      Show this domain reference
-  dns setup     Configure DNS forwarding to CoreDNS
-  dns test      Test domain resolution
-""")
+        print(_dns_list_body(host_ip, kamailio_ip, rtpengine_ip))
 
     def dns_setup(self):
         """Setup DNS forwarding to CoreDNS"""
         script_dir = self.config.get("project_dir", ".")
         script_path = os.path.join(script_dir, "scripts", "setup-dns.sh")
 
-        if not os.path.exists(script_path):
+        if not path_exists_cached(script_path):
             print(red(f"Setup script not found: {script_path}"))
             return
 
         print("Configuring DNS forwarding for *.voipbin.test to CoreDNS...\n")
-        os.system(script_path)
+        subprocess.run([script_path])
+        self._coredns_check = None  # setup may have (re)started CoreDNS
+        _PATH_EXISTS_CACHE.pop("/etc/resolver/voipbin.test", None)
 
     def dns_regenerate(self):
         """Regenerate CoreDNS configuration"""
         script_dir = self.config.get("project_dir", ".")
         script_path = os.path.join(script_dir, "scripts", "setup-dns.sh")
 
-        if not os.path.exists(script_path):
+        if not path_exists_cached(script_path):
             print(red(f"Setup script not found: {script_path}"))
             return
 
         print("Regenerating CoreDNS configuration (Corefile)...\n")
-        os.system(f"{script_path} --regenerate")
+        subprocess.run([script_path, "--regenerate"])
+        self._coredns_check = None  # regeneration restarts CoreDNS
+        _PATH_EXISTS_CACHE.pop("/etc/resolver/voipbin.test", None)
+
+    def _query_customer_id(self):
+        """Fetch a customer id for DNS tests, preferring a direct DB connection.
+
+        PyMySQL is already a local prerequisite for the migration tooling.
+        When it is importable, query the published MySQL port directly over a
+        connection that persists for the session; otherwise fall back to the
+        in-container mysql client via docker exec.
+        """
+        try:
+            import pymysql
+        except ImportError:
+            pymysql = None
+
+        if pymysql is not None:
+            if self._db_conn is None:
+                try:
+                    self._db_conn = pymysql.connect(
+                        host="127.0.0.1",
+                        port=3306,
+                        user="root",
+                        password="root_password",
+                        database="bin_manager",
+                        connect_timeout=2,
+                    )
+                except Exception:
+                    self._db_conn = None
+            if self._db_conn is not None:
+                try:
+                    with self._db_conn.cursor() as cursor:
+                        cursor.execute("SELECT id FROM customer LIMIT 1")
+                        row = cursor.fetchone()
+                    if row:
+                        value = row[0]
+                        return value.decode() if isinstance(value, bytes) else str(value)
+                    return ""
+                except Exception:
+                    # Connection went away (e.g. db restarted); drop it and
+                    # fall back to docker exec for this call.
+                    try:
+                        self._db_conn.close()
+                    except Exception:
+                        pass
+                    self._db_conn = None
+
+        return run_cmd(
+            "docker exec voipbin-db mysql -u root -proot_password -N -e "
+            "\"SELECT id FROM bin_manager.customer LIMIT 1\" 2>/dev/null"
+        )
 
     def dns_test(self):
         """Test DNS resolution for SIP domains"""
-        host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "localhost"
-        kamailio_ip = run_cmd("grep '^KAMAILIO_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or host_ip
+        env = self._load_env()
+        host_ip = env.get("HOST_EXTERNAL_IP") or "localhost"
+        kamailio_ip = env.get("KAMAILIO_EXTERNAL_IP") or host_ip
 
         # Get a customer ID if available
-        customer_id = run_cmd(
-            "docker exec voipbin-db mysql -u root -proot_password -N -e "
-            "\"SELECT id FROM bin_manager.customer LIMIT 1\" 2>/dev/null"
-        ) or "f1504bd0-9fd4-495b-a360-a73a6fa088b0"
+        customer_id = self._query_customer_id() or "f1504bd0-9fd4-495b-a360-a73a6fa088b0"
 
         print(f"\n{bold('Testing DNS Domain Resolution')}")
         print("-" * 60)
@@ -4018,17 +4514,16 @@ Type 'registrar <subcommand> help' for more details.
             ("meet.voipbin.test", host_ip),
             ("talk.voipbin.test", host_ip),
         ]
-        for domain, expected in external_tests:
-            result = run_cmd(f"dig +short {domain} @127.0.0.1 2>/dev/null | head -1")
-            if not result:
-                result = run_cmd(f"dig +short {domain} 2>/dev/null | head -1") or run_cmd(f"getent hosts {domain} 2>/dev/null | awk '{{print $1}}'")
+        external_results = self._resolve_many([d for d, _ in external_tests])
+
+        for (domain, expected), result in zip(external_tests, external_results):
             if result == expected:
-                print(f"    {green('✓')} {domain} → {result}")
+                print(f"    {GREEN_CHECK} {domain} → {result}")
             elif result:
-                print(f"    {yellow('!')} {domain} → {result} (expected: {expected})")
+                print(f"    {YELLOW_BANG} {domain} → {result} (expected: {expected})")
                 all_ok = False
             else:
-                print(f"    {red('✗')} {domain} → (no resolution)")
+                print(f"    {RED_CROSS} {domain} → (no resolution)")
                 all_ok = False
 
         # SIP services - resolve to Kamailio IP
@@ -4050,19 +4545,16 @@ Type 'registrar <subcommand> help' for more details.
             f"{customer_id}.registrar.voipbin.test",
         ]
 
-        for i, domain in enumerate(sip_domains_full):
-            display_domain = sip_domains[i]
-            result = run_cmd(f"dig +short {domain} @127.0.0.1 2>/dev/null | head -1")
-            if not result:
-                result = run_cmd(f"dig +short {domain} 2>/dev/null | head -1") or run_cmd(f"getent hosts {domain} 2>/dev/null | awk '{{print $1}}'")
+        sip_results = self._resolve_many(sip_domains_full)
 
+        for display_domain, result in zip(sip_domains, sip_results):
             if result == kamailio_ip:
-                print(f"    {green('✓')} {display_domain} → {result}")
+                print(f"    {GREEN_CHECK} {display_domain} → {result}")
             elif result:
-                print(f"    {yellow('!')} {display_domain} → {result} (expected: {kamailio_ip})")
+                print(f"    {YELLOW_BANG} {display_domain} → {result} (expected: {kamailio_ip})")
                 all_ok = False
             else:
-                print(f"    {red('✗')} {display_domain} → (no resolution)")
+                print(f"    {RED_CROSS} {display_domain} → (no resolution)")
                 all_ok = False
 
         print()
@@ -4085,6 +4577,7 @@ Type 'registrar <subcommand> help' for more details.
 
     def certs_status(self):
         """Check certificate configuration"""
+        import shutil
         project_dir = self.config.get("project_dir", ".")
         certs_dir = os.path.join(project_dir, "certs")
 
@@ -4092,19 +4585,19 @@ Type 'registrar <subcommand> help' for more details.
         print("-" * 50)
 
         # Check if mkcert is installed
-        mkcert_installed = run_cmd("which mkcert 2>/dev/null")
+        mkcert_installed = shutil.which("mkcert")
         if mkcert_installed:
-            print(f"  {green('●')} mkcert: installed")
+            print(f"  {GREEN_CIRCLE} mkcert: installed")
 
             # Check if CA is installed
             ca_check = run_cmd("mkcert -check 2>&1")
             if "is not installed" in ca_check.lower():
-                print(f"  {yellow('!')} mkcert CA: {yellow('not installed')}")
+                print(f"  {YELLOW_BANG} mkcert CA: {yellow('not installed')}")
                 print(f"      Run 'certs trust' to install CA for browser-trusted certificates")
             else:
-                print(f"  {green('●')} mkcert CA: installed (browser-trusted)")
+                print(f"  {GREEN_CIRCLE} mkcert CA: installed (browser-trusted)")
         else:
-            print(f"  {gray('○')} mkcert: not installed")
+            print(f"  {GRAY_CIRCLE} mkcert: not installed")
             print(f"      Install with: sudo apt install mkcert  # or: brew install mkcert")
 
         # Check certificates directory
@@ -4112,30 +4605,32 @@ Type 'registrar <subcommand> help' for more details.
         if os.path.isdir(certs_dir):
             api_cert = os.path.join(certs_dir, "api", "cert.pem")
             if os.path.exists(api_cert):
-                print(f"  {green('●')} API certificate: {api_cert}")
+                print(f"  {GREEN_CIRCLE} API certificate: {api_cert}")
             else:
-                print(f"  {red('○')} API certificate: not found")
-
-            # List other cert directories
-            for item in sorted(os.listdir(certs_dir)):
-                item_path = os.path.join(certs_dir, item)
-                if os.path.isdir(item_path) and item != "api":
-                    cert_file = os.path.join(item_path, "fullchain.pem")
-                    if os.path.exists(cert_file):
-                        print(f"  {green('●')} {item}: found")
+                print(f"  {RED_CIRCLE} API certificate: not found")
+
+            # List other cert directories. scandir reuses the dirent for
+            # is_dir(), so the fullchain stat is the only syscall per entry.
+            with os.scandir(certs_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False) and entry.name != "api":
+                        cert_file = os.path.join(entry.path, "fullchain.pem")
+                        if os.path.exists(cert_file):
+                            print(f"  {GREEN_CIRCLE} {entry.name}: found")
         else:
-            print(f"  {red('○')} Certificates directory not found")
+            print(f"  {RED_CIRCLE} Certificates directory not found")
             print(f"      Run 'init' to generate certificates")
 
         print()
 
     def certs_trust(self):
         """Install mkcert CA for browser-trusted certificates"""
+        import shutil
         print(f"\n{bold('Installing mkcert CA')}")
         print("-" * 50)
 
         # Check if mkcert is installed
-        mkcert_installed = run_cmd("which mkcert 2>/dev/null")
+        mkcert_installed = shutil.which("mkcert")
         if not mkcert_installed:
             print(red("mkcert is not installed."))
             print("\nInstall mkcert first:")
@@ -4145,9 +4640,9 @@ Type 'registrar <subcommand> help' for more details.
             return
 
         print("Installing mkcert CA (this makes certificates browser-trusted)...\n")
-        os.system("mkcert -install")
+        subprocess.run(["mkcert", "-install"])
 
-        print(f"\n{green('✓')} mkcert CA installed!")
+        print(f"\n{GREEN_CHECK} mkcert CA installed!")
         print("\nNext steps:")
         print("  1. Restart your browser")
         print("  2. If certificates were generated before CA install, regenerate them:")
@@ -4177,63 +4672,92 @@ Type 'registrar <subcommand> help' for more details.
 
     def network_status(self):
         """Show VoIP network configuration status"""
+        from concurrent.futures import ThreadPoolExecutor
+        _run_cached.cache_clear()  # re-probe fresh state for this render
         print(f"\n{bold('VoIP Network Configuration')}")
         print("=" * 60)
 
         # Get IPs from .env
-        host_ip = run_cmd("grep '^HOST_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or "not set"
-        kamailio_ip = run_cmd("grep '^KAMAILIO_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or ""
-        rtpengine_ip = run_cmd("grep '^RTPENGINE_EXTERNAL_IP=' .env 2>/dev/null | cut -d'=' -f2 | head -1") or ""
+        env = self._load_env()
+        host_ip = env.get("HOST_EXTERNAL_IP") or "not set"
+        kamailio_ip = env.get("KAMAILIO_EXTERNAL_IP") or ""
+        rtpengine_ip = env.get("RTPENGINE_EXTERNAL_IP") or ""
+
+        # Fan the independent probes out in parallel; each is a read-only
+        # fork and the section renderers below consume them in fixed order.
+        probe_cmds = {
+            "kamailio_int": ("ip", "addr", "show", "kamailio-int"),
+            "rtpengine_int": ("ip", "addr", "show", "rtpengine-int"),
+            "voip_internal": ("docker", "network", "inspect", "sandbox_voip-internal",
+                              "--format", "{{.Id}}"),
+            "default_network": ("docker", "network", "inspect", "sandbox_default",
+                                "--format", "{{.Id}}"),
+            "default_route": ("ip", "route", "get", "8.8.8.8"),
+        }
+        with ThreadPoolExecutor(max_workers=len(probe_cmds)) as executor:
+            futures = {name: executor.submit(_run_cached, cmd)
+                       for name, cmd in probe_cmds.items()}
+            probes = {name: future.result() for name, future in futures.items()}
+
+        def first_inet(output):
+            match = _INET_RE.search(output)
+            return match.group(1) if match else ""
 
         # Check internal interfaces
         print(f"\n{bold('Internal Interfaces')} (Docker bridge → host macvlan)")
         print("-" * 60)
 
-        kamailio_int = run_cmd("ip addr show kamailio-int 2>/dev/null | grep -oP 'inet \\K[\\d./]+' | head -1")
-        rtpengine_int = run_cmd("ip addr show rtpengine-int 2>/dev/null | grep -oP 'inet \\K[\\d./]+' | head -1")
+        kamailio_int = first_inet(probes["kamailio_int"])
+        rtpengine_int = first_inet(probes["rtpengine_int"])
 
         if kamailio_int:
-            print(f"  {green('●')} kamailio-int:  {kamailio_int}")
+            print(f"  {GREEN_CIRCLE} kamailio-int:  {kamailio_int}")
         else:
-            print(f"  {red('○')} kamailio-int:  not configured")
+            print(f"  {RED_CIRCLE} kamailio-int:  not configured")
 
         if rtpengine_int:
-            print(f"  {green('●')} rtpengine-int: {rtpengine_int}")
+            print(f"  {GREEN_CIRCLE} rtpengine-int: {rtpengine_int}")
         else:
-            print(f"  {red('○')} rtpengine-int: not configured")
+            print(f"  {RED_CIRCLE} rtpengine-int: not configured")
 
         # Check Docker network
         print(f"\n{bold('Docker Networks')}")
         print("-" * 60)
 
-        # Check if voip-internal network exists
-        voip_internal = run_cmd("docker network inspect sandbox_voip-internal --format '{{.Id}}' 2>/dev/null | head -c 12")
+        # Check if voip-internal network exists (bridge names use the first
+        # 12 characters of the network id, sliced here instead of head -c)
+        voip_internal = probes["voip_internal"][:12]
         if voip_internal:
             bridge_if = f"br-{voip_internal}"
-            bridge_exists = run_cmd(f"ip link show {bridge_if} 2>/dev/null | head -1")
+            bridge_exists = _run_cached(("ip", "link", "show", bridge_if))
             if bridge_exists:
-                print(f"  {green('●')} voip-internal: {bridge_if} (172.29.0.0/16)")
+                print(f"  {GREEN_CIRCLE} voip-internal: {bridge_if} (172.29.0.0/16)")
             else:
-                print(f"  {yellow('!')} voip-internal: network exists but bridge not found")
+                print(f"  {YELLOW_BANG} voip-internal: network exists but bridge not found")
         else:
-            print(f"  {gray('○')} voip-internal: not created (run 'docker compose up -d' first)")
+            print(f"  {GRAY_CIRCLE} voip-internal: not created (run 'docker compose up -d' first)")
 
-        default_network = run_cmd("docker network inspect sandbox_default --format '{{.Id}}' 2>/dev/null | head -c 12")
+        default_network = probes["default_network"][:12]
         if default_network:
-            print(f"  {green('●')} default:       br-{default_network} (172.28.0.0/16)")
+            print(f"  {GREEN_CIRCLE} default:       br-{default_network} (172.28.0.0/16)")
         else:
-            print(f"  {gray('○')} default:       not created")
+            print(f"  {GRAY_CIRCLE} default:       not created")
 
         # External configuration
         print(f"\n{bold('External Configuration')}")
         print("-" * 60)
         print(f"  HOST_EXTERNAL_IP: {blue(host_ip)}")
 
-        physical_iface = run_cmd("ip route get 8.8.8.8 2>/dev/null | grep -oP 'dev \\K\\S+' | head -1") or "eth0"
+        route_match = _DEV_RE.search(probes["default_route"])
+        physical_iface = route_match.group(1) if route_match else "eth0"
+
+        # One dump of the physical interface serves both IP checks and the
+        # address listing below.
+        iface_addrs = _INET_RE.findall(_run_cached(("ip", "addr", "show", physical_iface)))
+        iface_ip_set = {addr.split("/")[0] for addr in iface_addrs}
 
         if kamailio_ip:
-            ip_on_iface = run_cmd(f"ip addr show {physical_iface} 2>/dev/null | grep -oP 'inet \\K{kamailio_ip}'")
-            if ip_on_iface:
+            if kamailio_ip in iface_ip_set:
                 print(f"  KAMAILIO_EXTERNAL_IP:   {green(kamailio_ip)} (configured on {physical_iface})")
             else:
                 print(f"  KAMAILIO_EXTERNAL_IP:   {yellow(kamailio_ip)} (not yet applied)")
@@ -4241,8 +4765,7 @@ Type 'registrar <subcommand> help' for more details.
             print(f"  KAMAILIO_EXTERNAL_IP:   {red('not set')} (required for SIP)")
 
         if rtpengine_ip:
-            ip_on_iface = run_cmd(f"ip addr show {physical_iface} 2>/dev/null | grep -oP 'inet \\K{rtpengine_ip}'")
-            if ip_on_iface:
+            if rtpengine_ip in iface_ip_set:
                 print(f"  RTPENGINE_EXTERNAL_IP:  {green(rtpengine_ip)} (configured on {physical_iface})")
             else:
                 print(f"  RTPENGINE_EXTERNAL_IP:  {yellow(rtpengine_ip)} (not yet applied)")
@@ -4260,13 +4783,10 @@ Type 'registrar <subcommand> help' for more details.
         # Show physical interface IPs
         print(f"\n{bold('Physical Interface')}")
         print("-" * 60)
-        physical_iface = run_cmd("ip route get 8.8.8.8 2>/dev/null | grep -oP 'dev \\K\\S+' | head -1") or "unknown"
-        iface_ips = run_cmd(f"ip addr show {physical_iface} 2>/dev/null | grep -oP 'inet \\K[\\d./]+'")
-        if iface_ips:
+        if iface_addrs:
             print(f"  {physical_iface}:")
-            for ip in iface_ips.split('\n'):
-                if ip:
-                    print(f"    {ip}")
+            for ip in iface_addrs:
+                print(f"    {ip}")
         else:
             print(f"  Could not detect physical interface")
 
@@ -4282,45 +4802,48 @@ Type 'registrar <subcommand> help' for more details.
         script_dir = self.config.get("project_dir", ".")
         script_path = os.path.join(script_dir, "scripts", "setup-voip-network.sh")
 
-        if not os.path.exists(script_path):
+        if not path_exists_cached(script_path):
             print(red(f"Setup script not found: {script_path}"))
             return
 
         print(f"\n{bold('Setting up VoIP network interfaces...')}\n")
 
-        cmd = script_path
+        cmd = [script_path]
         if external_ip:
-            cmd += f" --external-ip {external_ip}"
+            cmd += ["--external-ip", external_ip]
 
-        os.system(cmd)
+        subprocess.run(cmd)
 
     def network_teardown(self):
         """Teardown VoIP network interfaces"""
         script_dir = self.config.get("project_dir", ".")
         script_path = os.path.join(script_dir, "scripts", "teardown-voip-network.sh")
 
-        if not os.path.exists(script_path):
+        if not path_exists_cached(script_path):
             print(red(f"Teardown script not found: {script_path}"))
             return
 
         print(f"\n{bold('Tearing down VoIP network interfaces...')}\n")
-        os.system(script_path)
+        subprocess.run([script_path])
 
     def cmd_init(self, args):
         """Initialize sandbox"""
         script_dir = self.config.get("project_dir", ".")
         script_path = os.path.join(script_dir, "scripts", "init.sh")
 
-        if not os.path.exists(script_path):
+        if not path_exists_cached(script_path):
             print(red(f"Init script not found: {script_path}"))
             return
 
         print("Running initialization script...")
         print("This will generate .env and certificates.\n")
-        os.system(script_path)
+        subprocess.run([script_path])
+        get_all_services.cache_clear()
 
     def cmd_clean(self, args):
         """Cleanup sandbox"""
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         if not args:
             print("Usage: clean [--containers] [--volumes] [--images] [--network] [--dns] [--purge] [--all]")
             print("")
@@ -4384,27 +4907,34 @@ Type 'registrar <subcommand> help' for more details.
             print("\nRemoving docker images...")
             # Get images from docker compose
             compose_images = run_cmd("docker compose config --images 2>/dev/null") or ""
-            # Get voipbin images
-            voipbin_images = run_cmd("docker images --format '{{.Repository}}:{{.Tag}}' | grep -E '^voipbin/' 2>/dev/null") or ""
-            # Get other sandbox images
-            other_images = run_cmd("docker images --format '{{.Repository}}:{{.Tag}}' | grep -E '^(mysql|redis|rabbitmq|coredns/)' 2>/dev/null") or ""
-
-            # Combine and deduplicate
-            all_images = set()
-            for img_list in [compose_images, voipbin_images, other_images]:
-                for img in img_list.strip().split('\n'):
-                    if img and '<none>' not in img:
-                        all_images.add(img)
-
+            # One docker images listing, filtered in Python (previously two
+            # more docker forks piped through grep)
+            local_images = run_argv(["docker", "images", "--format", "{{.Repository}}:{{.Tag}}"],
+                                    merge_stderr=False)
+            sandbox_prefixes = ("voipbin/", "mysql", "redis", "rabbitmq", "coredns/")
+
+            # Build the candidate set in one pass over each listing: every
+            # compose image plus any local image matching a sandbox prefix.
+            all_images = {img for img in compose_images.strip().split('\n')
+                          if img and '<none>' not in img}
+            all_images.update(img for img in local_images.split('\n')
+                              if img and '<none>' not in img and img.startswith(sandbox_prefixes))
+
+            # Removals are independent of each other, so fan them out; print
+            # each as it completes for progress feedback.
             removed = 0
-            for image in sorted(all_images):
-                result = run_cmd(f"docker rmi -f {image} 2>/dev/null")
-                if result is not None:
-                    print(f"  Removed: {image}")
-                    removed += 1
-
-            # Also try docker compose --rmi
-            run_cmd("docker compose down --rmi all 2>/dev/null")
+            if all_images:
+                with ThreadPoolExecutor(max_workers=min(len(all_images), 8)) as executor:
+                    futures = {executor.submit(run_cmd, f"docker rmi -f {image} 2>/dev/null"): image
+                               for image in sorted(all_images)}
+                    for future in as_completed(futures):
+                        if future.result() is not None:
+                            print(f"  Removed: {futures[future]}")
+                            removed += 1
+
+            # No trailing `docker compose down --rmi all` sweep: the compose
+            # images are already in the candidate set, so it only added a
+            # redundant daemon walk over the same image index.
             print(green(f"✓ Removed {removed} docker images"))
 
         # Teardown network
@@ -4412,7 +4942,7 @@ Type 'registrar <subcommand> help' for more details.
             print("\nTearing down VoIP network interfaces...")
             script_path = os.path.join(scripts_dir, "teardown-voip-network.sh")
             if os.path.exists(script_path):
-                os.system(f"{script_path} 2>/dev/null || true")
+                subprocess.run([script_path], stderr=subprocess.DEVNULL, check=False)
                 print(green("✓ Network interfaces removed"))
             else:
                 print(yellow("! teardown-voip-network.sh not found"))
@@ -4422,7 +4952,7 @@ Type 'registrar <subcommand> help' for more details.
             print("\nRemoving DNS configuration...")
             script_path = os.path.join(scripts_dir, "setup-dns.sh")
             if os.path.exists(script_path):
-                os.system(f"{script_path} --uninstall 2>/dev/null || true")
+                subprocess.run([script_path, "--uninstall"], stderr=subprocess.DEVNULL, check=False)
                 print(green("✓ DNS configuration removed"))
             else:
                 print(yellow("! setup-dns.sh not found"))
@@ -4446,7 +4976,6 @@ Type 'registrar <subcommand> help' for more details.
                 full_path = os.path.join(project_dir, path)
                 if os.path.exists(full_path):
                     if os.path.isdir(full_path):
-                        import shutil
                         shutil.rmtree(full_path)
                     else:
                         os.remove(full_path)
@@ -4454,6 +4983,9 @@ Type 'registrar <subcommand> help' for more details.
 
             print(green("✓ Generated files purged"))
 
+        get_all_services.cache_clear()
+        invalidate_compose_ps_cache()
+
         print(f"\n{bold('Cleanup complete!')}")
         print("Run 'init' to initialize, then 'start' to begin.")
 
@@ -4637,9 +5169,17 @@ Type 'registrar <subcommand> help' for more details.
         else:
             print(f"{red('Unknown subcommand:')} {subcommand}")
             print("Usage: update [scripts|all] [--check]")
+            return
+
+        if not check_only:
+            # A scripts update can change the compose file; drop the memoized
+            # service list so the next completion re-reads it.
+            get_all_services.cache_clear()
 
     def _update_images(self, project_dir, check_only=False):
         """Pull Docker images with version pinning to commit-SHA tags"""
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
         print(f"\n{bold('Docker Image Update')}")
         print("=" * 50)
 
@@ -4681,7 +5221,7 @@ Type 'registrar <subcommand> help' for more details.
                 short_name = w["image"].split("/")[-1]
                 print(f"  ! {short_name}: {w['error']}")
 
-        print(f"\n  {green('✓')} Resolved {len(resolved)}/{len(images)} images")
+        print(f"\n  {GREEN_CHECK} Resolved {len(resolved)}/{len(images)} images")
 
         if check_only:
             # Show current vs resolved
@@ -4697,10 +5237,7 @@ Type 'registrar <subcommand> help' for more details.
 
         if not resolved:
             print(yellow("No images resolved. Falling back to docker compose pull."))
-            result = run_cmd("docker compose pull 2>&1")
-            if result:
-                for line in result.strip().split('\n')[-10:]:
-                    print(f"  {line}")
+            stream_compose_pull(tail_lines=10, echo=True)
             return
 
         # Backup existing override file (if exists)
@@ -4717,13 +5254,13 @@ Type 'registrar <subcommand> help' for more details.
         override_content = self._generate_override_content(resolved, warnings, image_to_services)
         with open(override_file, "w") as f:
             f.write(override_content)
-        print(f"  {green('✓')} Override file generated")
+        print(f"  {GREEN_CHECK} Override file generated")
 
         # Save new version to history
         timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
         history_file = os.path.join(versions_dir, f"{timestamp}.yml")
         shutil.copy2(override_file, history_file)
-        print(f"  {green('✓')} Saved to rollback history")
+        print(f"  {GREEN_CHECK} Saved to rollback history")
 
         # Cleanup old backups (keep last 100)
         backups = sorted(Path(versions_dir).glob("*.yml"))
@@ -4736,12 +5273,13 @@ Type 'registrar <subcommand> help' for more details.
 
         def pull_images():
             """Pull pinned images"""
-            result = run_cmd("docker compose pull 2>&1")
-            return result
+            # No live echo here: this runs alongside the migration task and
+            # only the tail is shown once both finish.
+            return stream_compose_pull(tail_lines=5, echo=False)
 
         def run_migrations():
             """Run database migrations if possible"""
-            alembic_check = run_cmd("which alembic 2>/dev/null")
+            alembic_check = shutil.which("alembic")
             if not alembic_check:
                 return "skip", "Alembic not found"
 
@@ -4751,7 +5289,8 @@ Type 'registrar <subcommand> help' for more details.
 
             script_path = os.path.join(project_dir, "scripts", "init_database.sh")
             if os.path.exists(script_path):
-                os.system(f"{script_path} > /dev/null 2>&1")
+                subprocess.run([script_path], stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, check=False)
                 return "done", None
 
             return "skip", "Migration script not found"
@@ -4766,22 +5305,21 @@ Type 'registrar <subcommand> help' for more details.
             migration_status, migration_msg = migration_future.result()
 
         # Show results
-        if pull_result:
-            lines = pull_result.strip().split('\n')
-            for line in lines[-5:]:
-                print(f"  {line}")
-        print(f"  {green('✓')} Images pulled")
+        for line in pull_result:
+            print(f"  {line}")
+        print(f"  {GREEN_CHECK} Images pulled")
 
         if migration_status == "done":
-            print(f"  {green('✓')} Database migrations complete")
+            print(f"  {GREEN_CHECK} Database migrations complete")
         elif migration_status == "skip":
-            print(f"  {yellow('!')} Migrations skipped: {migration_msg}")
+            print(f"  {YELLOW_BANG} Migrations skipped: {migration_msg}")
 
         # Restart services
-        running_services = run_cmd("docker compose ps -q 2>/dev/null")
-        if running_services:
+        invalidate_compose_ps_cache()
+        if get_compose_ps():
             print(f"\n{blue('==>')} Restarting services with new images...")
             run_cmd("docker compose up -d 2>&1")
+            invalidate_compose_ps_cache()
             print(green("✓ Services restarted"))
 
         print(f"\n{bold('Image update complete!')}")
@@ -4896,7 +5434,7 @@ Type 'registrar <subcommand> help' for more details.
 
         backup_path = self._create_backup(project_dir, significant_changes)
         if backup_path:
-            print(f"\n{green('✓')} Backup created: {backup_path}")
+            print(f"\n{GREEN_CHECK} Backup created: {backup_path}")
 
         stashed = False
         if significant_changes:
@@ -4933,6 +5471,7 @@ Type 'registrar <subcommand> help' for more details.
 
     def _create_backup(self, project_dir, changed_files):
         """Create a backup of modified files before updating"""
+        import shutil
         if not changed_files:
             return None
 
@@ -4980,6 +5519,7 @@ Type 'registrar <subcommand> help' for more details.
 
     def _cleanup_old_backups(self, project_dir):
         """Keep only the last MAX_BACKUPS backups"""
+        import shutil
         backup_base = os.path.join(project_dir, BACKUP_DIR)
         if not os.path.exists(backup_base):
             return
@@ -5196,11 +5736,12 @@ Type 'registrar <subcommand> help' for more details.
 
     def _restore_version(self, project_dir, version, override_file):
         """Restore a specific version"""
+        import shutil
         print(f"\n{blue('==>')} Restoring version from {version['timestamp'].strftime('%Y-%m-%d %H:%M')}...")
 
         # Copy the version file to override
         shutil.copy2(version["path"], override_file)
-        print(f"  {green('✓')} Restored docker-compose.override.yml")
+        print(f"  {GREEN_CHECK} Restored docker-compose.override.yml")
 
         # Ask to restart services
         print(f"\n{yellow('Services need to be restarted to use the restored version.')}")
@@ -5216,6 +5757,7 @@ Type 'registrar <subcommand> help' for more details.
 
     def _rollback_scripts(self, project_dir, args):
         """Rollback scripts to a previous backup (legacy)"""
+        import shutil
         backup_base = os.path.join(project_dir, BACKUP_DIR)
 
         if "--list" in args or "list" in args:
@@ -5300,10 +5842,10 @@ Type 'registrar <subcommand> help' for more details.
             try:
                 os.makedirs(os.path.dirname(dst_path), exist_ok=True)
                 shutil.copy2(src_path, dst_path)
-                print(f"  {green('✓')} {file_info['path']}")
+                print(f"  {GREEN_CHECK} {file_info['path']}")
                 restored += 1
             except Exception as e:
-                print(f"  {red('✗')} {file_info['path']}: {e}")
+                print(f"  {RED_CROSS} {file_info['path']}: {e}")
 
         print(f"\n{bold('Rollback complete!')} Restored {restored} file(s).")
 
@@ -5356,9 +5898,56 @@ Type 'registrar <subcommand> help' for more details.
 # =============================================================================
 
 class Completer:
+    # Static per-command candidate lists, presorted (with their completion
+    # suffix baked in) so lookups are a dict hit plus two bisects instead of
+    # rebuilding and scanning a list on every tab press.
+    _STATIC_MATCHES = {
+        "ext": sorted(s + " " for s in ("list", "create", "delete")),
+        "customer": sorted(s + " " for s in ("info", "create")),
+        "network": sorted(s + " " for s in ("status", "setup", "teardown")),
+        "dns": sorted(s + " " for s in ("status", "list", "setup", "regenerate", "test")),
+        "certs": sorted(s + " " for s in ("status", "trust")),
+        "ast": sorted((
+            "pjsip show endpoints", "pjsip show contacts", "pjsip show aors",
+            "core show channels", "core show calls", "core show version",
+            "sip show peers", "sip show registry",
+            "dialplan show", "module show",
+        )),
+        "kam": sorted((
+            "ul.dump", "ul.lookup", "stats.get_statistics",
+            "tm.stats", "sl.stats", "core.version",
+        )),
+        "rollback": ["--list "],
+        "clean": sorted(s + " " for s in (
+            "--containers", "--volumes", "--images", "--network", "--dns", "--purge", "--all")),
+    }
+    _STATIC_MATCHES["extension"] = _STATIC_MATCHES["ext"]
+    _STATIC_MATCHES["asterisk"] = _STATIC_MATCHES["ast"]
+    _STATIC_MATCHES["kamailio"] = _STATIC_MATCHES["kam"]
+
+    _CONTEXT_MATCHES = {
+        "asterisk": sorted((
+            "pjsip show endpoints", "pjsip show contacts",
+            "core show channels", "core show calls",
+            "exit", "quit",
+        )),
+        "api": sorted(c + " " for c in ("login", "get", "post", "put", "delete", "exit", "quit")),
+    }
+
     def __init__(self, cli):
         self.cli = cli
         self.matches = []
+        # Command names only change at startup; sort them once.
+        self._commands = sorted(c + " " for c in cli.commands)
+
+    @staticmethod
+    def _prefix_range(sorted_items, text):
+        """Items starting with text, located with two bisects on a sorted list."""
+        if not text:
+            return list(sorted_items)
+        lo = bisect.bisect_left(sorted_items, text)
+        hi = bisect.bisect_left(sorted_items, text + "\uffff")
+        return sorted_items[lo:hi]
 
     def complete(self, text, state):
         if state == 0:
@@ -5380,8 +5969,7 @@ class Completer:
 
         # Empty line or first word - complete commands
         if not parts or (len(parts) == 1 and not line.endswith(" ")):
-            commands = list(self.cli.commands.keys())
-            return [c + " " for c in commands if c.startswith(text)]
+            return self._prefix_range(self._commands, text)
 
         # Second word - context-specific completion
         cmd = parts[0].lower()
@@ -5393,79 +5981,28 @@ class Completer:
                 return ["-f "]
             return [s + " " for s in services if s.startswith(text)]
 
-        if cmd in ("ext", "extension"):
-            subcmds = ["list", "create", "delete"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
-        if cmd == "customer":
-            subcmds = ["info", "create"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
-        if cmd == "network":
-            subcmds = ["status", "setup", "teardown"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
-        if cmd == "dns":
-            subcmds = ["status", "list", "setup", "regenerate", "test"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
-        if cmd == "certs":
-            subcmds = ["status", "trust"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
         if cmd == "config":
             if len(parts) == 1 or (len(parts) == 2 and not line.endswith(" ")):
                 keys = list(self.cli.config.data.keys()) + ["reset"]
                 return [k + " " for k in keys if k.startswith(text)]
-
-        if cmd in ("ast", "asterisk"):
-            # Common Asterisk commands
-            ast_cmds = [
-                "pjsip show endpoints", "pjsip show contacts", "pjsip show aors",
-                "core show channels", "core show calls", "core show version",
-                "sip show peers", "sip show registry",
-                "dialplan show", "module show",
-            ]
-            return [c for c in ast_cmds if c.startswith(text)]
-
-        if cmd in ("kam", "kamailio"):
-            # Common kamcmd commands
-            kam_cmds = [
-                "ul.dump", "ul.lookup", "stats.get_statistics",
-                "tm.stats", "sl.stats", "core.version",
-            ]
-            return [c for c in kam_cmds if c.startswith(text)]
+            return []
 
         if cmd == "update":
-            subcmds = ["scripts", "all", "--check"]
             if len(parts) >= 2 and parts[1] in ("scripts", "all"):
                 return ["--check "] if "--check".startswith(text) else []
-            return [s + " " for s in subcmds if s.startswith(text)]
+            return [s + " " for s in ("scripts", "all", "--check") if s.startswith(text)]
 
-        if cmd == "rollback":
-            subcmds = ["--list"]
-            return [s + " " for s in subcmds if s.startswith(text)]
-
-        if cmd == "clean":
-            subcmds = ["--containers", "--volumes", "--images", "--network", "--dns", "--purge", "--all"]
-            return [s + " " for s in subcmds if s.startswith(text)]
+        static = self._STATIC_MATCHES.get(cmd)
+        if static is not None:
+            return self._prefix_range(static, text)
 
         return []
 
     def context_matches(self, text):
         """Get matches for context mode"""
-        if self.cli.context == "asterisk":
-            cmds = [
-                "pjsip show endpoints", "pjsip show contacts",
-                "core show channels", "core show calls",
-                "exit", "quit"
-            ]
-            return [c for c in cmds if c.startswith(text)]
-
-        if self.cli.context == "api":
-            cmds = ["login", "get", "post", "put", "delete", "exit", "quit"]
-            return [c + " " for c in cmds if c.startswith(text)]
-
+        candidates = self._CONTEXT_MATCHES.get(self.cli.context)
+        if candidates is not None:
+            return self._prefix_range(candidates, text)
         return ["exit ", "quit "]
 
 
@@ -5476,14 +6013,32 @@ class Completer:
 def setup_readline(cli):
     """Setup readline with history and completion"""
     # History
+    history_loaded = False
     if HISTORY_FILE.exists():
         try:
             readline.read_history_file(HISTORY_FILE)
+            history_loaded = True
         except (IOError, OSError):
             pass
 
     readline.set_history_length(cli.config.get("history_size", 1000))
-    atexit.register(lambda: readline.write_history_file(HISTORY_FILE))
+    initial_history_length = readline.get_current_history_length()
+
+    def _save_history():
+        try:
+            # Append only this session's entries instead of rewriting the
+            # whole file on exit. libedit builds lack append_history_file,
+            # and appending needs the file to already exist.
+            new_entries = readline.get_current_history_length() - initial_history_length
+            if history_loaded and hasattr(readline, "append_history_file"):
+                if new_entries > 0:
+                    readline.append_history_file(new_entries, str(HISTORY_FILE))
+            else:
+                readline.write_history_file(HISTORY_FILE)
+        except (IOError, OSError):
+            pass  # e.g. read-only home; don't traceback during interpreter exit
+
+    atexit.register(_save_history)
 
     # Tab completion
     completer = Completer(cli)